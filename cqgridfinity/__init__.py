@@ -12,7 +12,7 @@ VERSION = __project__ + "-" + __version__
 script_dir = os.path.dirname(__file__)
 
 from .constants import *
-from .gf_obj import GridfinityObject
+from .gf_obj import GridfinityObject, clear_render_cache
 from .gf_baseplate import GridfinityBaseplate
 from .gf_box import GridfinityBox, GridfinitySolidBox
 from .gf_drawer import GridfinityDrawerSpacer
@@ -23,6 +23,8 @@
 #
 # Gridfinity Baseplates
 
+from collections import OrderedDict
+from functools import lru_cache
 import warnings
 
 import cadquery as cq
@@ -58,20 +60,61 @@ from cqgridfinity.constants import (
     GRU_CUT,
 )
 from cqgridfinity.gf_obj import GridfinityObject
-from cqgridfinity.gf_holes import (
-    cut_magnet_holes,
-    cut_screw_holes,
-    cut_enhanced_holes,
+from cqgridfinity.gf_helpers import (
+    NO_RENDER_CACHE,
+    cached_rr_sketch,
+    compound_from_pts,
+    register_cache,
 )
+from cqgridfinity.gf_holes import cut_holes_batched
 from cqkit.cq_helpers import (
-    rounded_rect_sketch,
     composite_from_pts,
     rotate_x,
     recentre,
 )
 from cqkit import VerticalEdgeSelector, HasZCoordinateSelector
 
-
+# Receptacle plates (outer block with the grid of bin receptacles cut into
+# it) shared between baseplates, most recently used last. Used by
+# GridfinityBaseplate._receptacle_plate().
+_PLATE_CACHE = register_cache(OrderedDict())
+_PLATE_CACHE_SIZE = 0 if NO_RENDER_CACHE else 8
+
+
+def _axis_centres(length_u, width_u, ox, oy):
+    """Cell centre X and Y coordinates; the grid is their outer product."""
+    xs = [(i - (length_u - 1) / 2) * GRU + ox for i in range(length_u)]
+    ys = [(j - (width_u - 1) / 2) * GRU + oy for j in range(width_u)]
+    return xs, ys
+
+
+# Cell and hole positions only depend on the grid size and offset, so they
+# are computed once and shared as tuples between baseplates and renders
+@register_cache
+@lru_cache(maxsize=32)
+def _cell_centres(length_u, width_u, ox, oy):
+    xs, ys = _axis_centres(length_u, width_u, ox, oy)
+    return tuple((x, y) for x in xs for y in ys)
+
+
+@register_cache
+@lru_cache(maxsize=32)
+def _hole_centres(length_u, width_u, ox, oy):
+    xs, ys = _axis_centres(length_u, width_u, ox, oy)
+    return tuple(
+        (x + GR_HOLE_DIST * di, y + GR_HOLE_DIST * dj)
+        for x in xs
+        for y in ys
+        for di in (-1, 1)
+        for dj in (-1, 1)
+    )
+
+
+@GridfinityObject.register(
+    lambda length_u, width_u, height_u, **kwargs: GridfinityBaseplate(
+        length_u, width_u, **kwargs
+    )
+)
 class GridfinityBaseplate(GridfinityObject):
     """Gridfinity Baseplate
 
@@ -208,32 +251,14 @@ class GridfinityBaseplate(GridfinityObject):
     def _bp_cell_centres(self):
         """Grid cell centres in the baseplate coordinate system (centered).
         Offset by _grid_offset when fit-to-drawer is active."""
-        ox, oy = self._grid_offset
-        return [
-            (
-                (i - (self.length_u - 1) / 2) * GRU + ox,
-                (j - (self.width_u - 1) / 2) * GRU + oy,
-            )
-            for i in range(self.length_u)
-            for j in range(self.width_u)
-        ]
+        return _cell_centres(self.length_u, self.width_u, *self._grid_offset)
 
     @property
     def _bp_hole_centres(self):
         """Magnet/screw hole positions in the baseplate coordinate system (centered).
         Four holes per grid cell at corners, offset GR_HOLE_DIST from cell centre.
         Offset by _grid_offset when fit-to-drawer is active."""
-        ox, oy = self._grid_offset
-        return [
-            (
-                (i - (self.length_u - 1) / 2) * GRU + GR_HOLE_DIST * di + ox,
-                (j - (self.width_u - 1) / 2) * GRU + GR_HOLE_DIST * dj + oy,
-            )
-            for i in range(self.length_u)
-            for j in range(self.width_u)
-            for di in (-1, 1)
-            for dj in (-1, 1)
-        ]
+        return _hole_centres(self.length_u, self.width_u, *self._grid_offset)
 
     def _corner_pts(self):
         oxy = self.corner_tab_size / 2
@@ -291,16 +316,36 @@ class GridfinityBaseplate(GridfinityObject):
             fn += "_fit%dx%d" % (int(self.distancex), int(self.distancey))
         return fn
 
-    def render(self):
+    def _receptacle_plate(self):
+        """Outer block with the grid of bin receptacles cut into it.
+
+        This is the part of the render common to every feature combination
+        with the same size, depth and bottom style, so the shape is built
+        once and shared (see _PLATE_CACHE). Each call returns it on a fresh
+        Workplane so that no workplane context is shared between renders.
+        """
+        solid_slab = self._has_bottom_features and self.ext_depth > 0
+        key = (
+            self.grid_centres,
+            self._fit_length,
+            self._fit_width,
+            self._grid_offset if self._is_fit_to_drawer else None,
+            self.ext_depth,
+            self.straight_bottom,
+            solid_slab,
+        )
+        if key in _PLATE_CACHE:
+            _PLATE_CACHE.move_to_end(key)
+            return cq.Workplane("XY").add(_PLATE_CACHE[key])
         profile = GR_BASE_PROFILE if not self.straight_bottom else GR_STR_BASE_PROFILE
         total_h = GR_BASE_HEIGHT + self.ext_depth
-        if self._has_bottom_features and self.ext_depth > 0:
+        if solid_slab:
             # For features that need solid material below the receptacle:
             # DON'T extend the receptacle profile. Instead, keep the standard
             # profile depth and let the outer block provide a solid slab below.
             # The receptacle sits on top of the slab at Z=ext_depth.
             rc = self.extrude_profile(
-                rounded_rect_sketch(GRU_CUT, GRU_CUT, GR_RAD), profile
+                cached_rr_sketch(GRU_CUT, GRU_CUT, GR_RAD), profile
             )
             rc = rotate_x(rc, 180).translate(
                 (GRU2, GRU2, total_h)
@@ -310,7 +355,7 @@ class GridfinityBaseplate(GridfinityObject):
             if self.ext_depth > 0:
                 profile = [*profile, self.ext_depth]
             rc = self.extrude_profile(
-                rounded_rect_sketch(GRU_CUT, GRU_CUT, GR_RAD), profile
+                cached_rr_sketch(GRU_CUT, GRU_CUT, GR_RAD), profile
             )
             rc = rotate_x(rc, 180).translate(
                 (GRU2, GRU2, total_h)
@@ -328,6 +373,15 @@ class GridfinityBaseplate(GridfinityObject):
             .faces(">Z")
             .cut(rc)
         )
+        shape = r.val()
+        if _PLATE_CACHE_SIZE > 0:
+            _PLATE_CACHE[key] = shape
+            if len(_PLATE_CACHE) > _PLATE_CACHE_SIZE:
+                _PLATE_CACHE.popitem(last=False)
+        return cq.Workplane("XY").add(shape)
+
+    def render(self):
+        r = self._receptacle_plate()
         if self.corner_screws:
             rs = cq.Sketch().rect(self.corner_tab_size, self.corner_tab_size)
             rs = cq.Workplane("XY").placeSketch(rs).extrude(self.ext_depth)
@@ -388,6 +442,9 @@ class GridfinityBaseplate(GridfinityObject):
 
         # Build one pocket shape per corner direction, then tile across cells.
         # Each pocket = rounded rectangle − keepout cylinder at the hole site.
+        # Pockets are separated by the ribs, so all of them are gathered in
+        # one compound and cut from the slab in a single boolean.
+        pockets = []
         for dx in (-1, 1):
             for dy in (-1, 1):
                 rect = (
@@ -406,13 +463,13 @@ class GridfinityBaseplate(GridfinityObject):
                 )
                 pocket = rect.cut(keepout)
 
-                pts = [
+                pts = (
                     (cx + dx * offset, cy + dy * offset, 0)
                     for cx, cy in self._bp_cell_centres
-                ]
-                obj = obj.cut(composite_from_pts(pocket, pts))
+                )
+                pockets.append(compound_from_pts(pocket, pts))
 
-        return obj
+        return obj.cut(cq.Compound.makeCompound(pockets))
 
     def _render_screw_together_holes(self, obj):
         """Cut horizontal screw holes along all 4 edges for joining baseplates.
@@ -476,10 +533,16 @@ class GridfinityBaseplate(GridfinityObject):
                 y_pts.append((ox + cx + off, oy + half_ly - hole_len / 2, hole_z))
                 y_pts.append((ox + cx + off, oy - half_ly + hole_len / 2, hole_z))
 
+        # X and Y holes can cross near the corners, so the two sets are
+        # fused into one tool and cut from the slab in a single boolean
+        holes = None
         if x_pts:
-            obj = obj.cut(composite_from_pts(x_hole, x_pts))
+            holes = composite_from_pts(x_hole, x_pts)
         if y_pts:
-            obj = obj.cut(composite_from_pts(y_hole, y_pts))
+            y_holes = composite_from_pts(y_hole, y_pts)
+            holes = y_holes if holes is None else holes.union(y_holes)
+        if holes is not None:
+            obj = obj.cut(holes)
         return obj
 
     def _render_baseplate_holes(self, obj):
@@ -491,29 +554,26 @@ class GridfinityBaseplate(GridfinityObject):
         Screw holes pass through the remaining material to the bottom.
 
         When enhanced hole options are set (refined, crush_ribs, chamfer,
-        printable_top), uses cut_enhanced_holes() instead of basic cuts.
+        printable_top), the enhanced magnet tool is used instead of the basic
+        one. Magnet and screw holes are cut in a single boolean.
         """
         pts = self._bp_hole_centres
         mag_depth = self._magnet_hole_depth
-        if self.magnet_holes:
-            if self._has_enhanced_holes:
-                obj = cut_enhanced_holes(
-                    obj,
-                    pts,
-                    z_offset=self.ext_depth - mag_depth,
-                    refined=self.refined_holes,
-                    crush_ribs=self.crush_ribs,
-                    chamfer=self.chamfer_holes,
-                    printable_top=self.printable_hole_top,
-                )
-            else:
-                obj = cut_magnet_holes(
-                    obj, pts, z_offset=self.ext_depth - GR_HOLE_H
-                )
+        mag_z = self.ext_depth - mag_depth if self.magnet_holes else None
+        screw_depth = None
         if self.screw_holes:
-            top = self.ext_depth - mag_depth if self.magnet_holes else self.ext_depth
-            obj = cut_screw_holes(obj, pts, depth=top)
-        return obj
+            screw_depth = mag_z if self.magnet_holes else self.ext_depth
+        # Magnet recesses and the screw holes below them are cut together
+        return cut_holes_batched(
+            obj,
+            pts,
+            magnet_z_offset=mag_z,
+            screw_depth=screw_depth,
+            refined=self.refined_holes,
+            crush_ribs=self.crush_ribs,
+            chamfer=self.chamfer_holes,
+            printable_top=self.printable_hole_top,
+        )
 
     def _render_weight_pockets(self, obj):
         """Cut weight pockets from the bottom of a weighted baseplate.
@@ -543,9 +603,7 @@ class GridfinityBaseplate(GridfinityObject):
             .translate((0, 0, -EPS))
         )
         pocket = pocket.union(chan_x).union(chan_y)
-        pockets = composite_from_pts(
-            pocket, [(x, y, 0) for x, y in self._bp_cell_centres]
-        )
-        obj = obj.cut(pockets)
+        # One pocket per cell; pockets never overlap so they are cut together
+        obj = obj.cut(compound_from_pts(pocket, self._bp_cell_centres))
         return obj
 
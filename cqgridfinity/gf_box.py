@@ -23,6 +23,8 @@
 #
 # Gridfinity Boxes
 
+from collections import OrderedDict
+from functools import cached_property
 import math
 import warnings
 
@@ -63,10 +65,37 @@ from cqgridfinity.constants import (
     SQRT2,
 )
 from cqgridfinity.gf_obj import GridfinityObject
+from cqgridfinity.gf_helpers import NO_RENDER_CACHE, compound_from_pts, register_cache
 from cqgridfinity.gf_holes import (
     cut_enhanced_holes,
     hole_filler,
 )
+
+# Per grid cell solids (the base foot and the lite style base interior),
+# keyed by the few attributes they depend on, most recently used last. They
+# are the same for every bin size and feature combination.
+_CELL_CACHE = register_cache(OrderedDict())
+_CELL_CACHE_SIZE = 0 if NO_RENDER_CACHE else 16
+
+
+def _cached_cell(key, build):
+    """Returns the per cell solid for key on a fresh Workplane, calling build()
+    to make the shape on a cache miss."""
+    if key in _CELL_CACHE:
+        _CELL_CACHE.move_to_end(key)
+        return cq.Workplane("XY").add(_CELL_CACHE[key])
+    shape = build()
+    _CELL_CACHE[key] = shape
+    if len(_CELL_CACHE) > _CELL_CACHE_SIZE:
+        _CELL_CACHE.popitem(last=False)
+    return cq.Workplane("XY").add(shape)
+
+
+@GridfinityObject.register(
+    lambda length_u, width_u, height_u, **kwargs: GridfinityBox(
+        length_u, width_u, height_u, **kwargs
+    )
+)
 class GridfinityBox(GridfinityObject):
     """Gridfinity Box
 
@@ -198,6 +227,7 @@ class GridfinityBox(GridfinityObject):
             )
         self._int_shell = None
         self._ext_shell = None
+        self._cyl_pts_cache = None
 
     def __str__(self):
         s = []
@@ -268,7 +298,7 @@ class GridfinityBox(GridfinityObject):
             return content_mm
         return content_mm + GRHU - rem
 
-    @property
+    @cached_property
     def height(self):
         """Total bin height in mm, derived from height_u via gridz_define mode (1B.14).
 
@@ -367,7 +397,7 @@ class GridfinityBox(GridfinityObject):
         """Grid unit size: 21mm for half-grid (1B.13), 42mm for standard bins."""
         return GRU2 if self.half_grid else GRU
 
-    @property
+    @cached_property
     def hole_centres(self):
         """Magnet/screw hole positions for this bin.
 
@@ -377,7 +407,7 @@ class GridfinityBox(GridfinityObject):
         pre-translation frame.  Ensures physical compatibility with standard
         Gridfinity baseplates (42mm grid, ±13mm hole offset).
 
-        Returns [] when the bin is too small to fit any full-grid-aligned holes,
+        Returns () when the bin is too small to fit any full-grid-aligned holes,
         i.e. when floor(length_u/2) < 1 or floor(width_u/2) < 1.
         """
         if not self.half_grid:
@@ -385,7 +415,7 @@ class GridfinityBox(GridfinityObject):
         n_full_l = math.floor(self.length_u / 2)
         n_full_w = math.floor(self.width_u / 2)
         if n_full_l < 1 or n_full_w < 1:
-            return []
+            return ()
         # Deduplicated corner cells in the full-grid equivalent
         seen: set = set()
         corners = []
@@ -407,7 +437,7 @@ class GridfinityBox(GridfinityObject):
             for di in (-1, 1):
                 for dj in (-1, 1):
                     result.append((cx - GR_HOLE_DIST * di, -(cy - GR_HOLE_DIST * dj)))
-        return result
+        return tuple(result)
 
     @property
     def half_in(self):
@@ -586,7 +616,9 @@ class GridfinityBox(GridfinityObject):
         lw = self.label_width
         if backwall:
             lw += self.lip_width
-        lh = self.label_height * (lw / self.label_width)
+        lh = self.label_height
+        if self.label_width:
+            lh *= lw / self.label_width
         yl = self.max_height - self.label_height + self.wall_th
         if backwall:
             yl -= self.lip_width
@@ -595,7 +627,8 @@ class GridfinityBox(GridfinityObject):
         elif yl < 1.5 * GR_FILLET:
             lh -= 1.5 * GR_FILLET - yl + 0.1
         if from_bottom:
-            ws = math.sin(math.atan2(self.label_height, self.label_width))
+            h = math.hypot(self.label_height, self.label_width)
+            ws = self.label_height / h if h else 0
             if backwall:
                 lh = self.max_height + GR_FLOOR - lh + ws * self.wall_th
             else:
@@ -665,27 +698,39 @@ class GridfinityBox(GridfinityObject):
     def base_interior(self):
         profile = [GR_BASE_HEIGHT, *GR_BOX_PROFILE]
         zo = GR_BASE_HEIGHT + GR_BASE_CLR
+        h = None
         if self.int_height < 0:
             h = self.bin_height - GR_BASE_HEIGHT
             profile = [h, *profile]
             zo += h
         cell = self._gru  # 21mm for half-grid, 42mm for standard (1B.13)
-        r = self.extrude_profile(
-            rounded_rect_sketch(cell - GR_TOL, cell - GR_TOL, self.outer_rad),
-            profile,
-        )
-        rx = r.faces("<Z").shell(-self.wall_th)
-        r = r.cut(rx).mirror(mirrorPlane="XY").translate((0, 0, zo))
-        return r
+
+        def build():
+            r = self.extrude_profile(
+                rounded_rect_sketch(cell - GR_TOL, cell - GR_TOL, self.outer_rad),
+                profile,
+            )
+            rx = r.faces("<Z").shell(-self.wall_th)
+            return r.cut(rx).mirror(mirrorPlane="XY").translate((0, 0, zo)).val()
+
+        return _cached_cell(("interior", cell, self.outer_rad, self.wall_th, h), build)
+
+    def render_foot(self):
+        """Renders the base foot below a single grid cell."""
+
+        def build():
+            sketch = rounded_rect_sketch(
+                self._gru, self._gru, self.outer_rad + GR_BASE_CLR
+            )
+            r = self.extrude_profile(sketch, GR_BOX_PROFILE)
+            r = r.translate((0, 0, -GR_BASE_CLR))
+            return r.mirror(mirrorPlane="XY").val()
+
+        return _cached_cell(("foot", self._gru, self.outer_rad), build)
 
     def render_shell(self, as_solid=False):
         """Renders the box shell without any added features."""
-        r = self.extrude_profile(
-            rounded_rect_sketch(self._gru, self._gru, self.outer_rad + GR_BASE_CLR), GR_BOX_PROFILE
-        )
-        r = r.translate((0, 0, -GR_BASE_CLR))
-        r = r.mirror(mirrorPlane="XY")
-        r = composite_from_pts(r, self.grid_centres)
+        r = composite_from_pts(self.render_foot(), self.grid_centres)
         rs = rounded_rect_sketch(*self.outer_dim, self.outer_rad)
         rw = (
             cq.Workplane("XY")
@@ -765,12 +810,13 @@ class GridfinityBox(GridfinityObject):
         if self.width_div > 0:
             # add scoops along each internal dividing wall in the width dimension
             yl = self.inner_w / (self.width_div + 1)
-            pts = [
-                (-self.half_in, (y + 1) * yl - self.half_in)
-                for y in range(self.width_div)
-            ]
-            rs = composite_from_pts(rsc, pts)
-            r = r.union(rs.translate((0, GR_DIV_WALL / 2 + srad / 2, zo)))
+            # The divider scoops are disjoint, so they are placed as one
+            # compound with the offset folded into each point
+            dy = GR_DIV_WALL / 2 + srad / 2 - self.half_in
+            pts = (
+                (-self.half_in, (y + 1) * yl + dy, zo) for y in range(self.width_div)
+            )
+            r = r.union(compound_from_pts(rsc, pts))
             r = r.intersect(self.render_shell(as_solid=True))
         return r
 
@@ -906,8 +952,12 @@ class GridfinityBox(GridfinityObject):
         if not self.hole_centres:
             return obj
         filler = hole_filler(self.hole_diam, GR_HOLE_SLICE)
-        fillers = composite_from_pts(filler, self.hole_centres)
-        return obj.union(fillers.translate((-self.half_l, self.half_w, 0)))
+        # Fillers at neighbouring holes never touch, so they are added as one
+        # compound rather than pre-fused. The frame offset is folded into each
+        # placement instead of transforming the whole compound afterwards.
+        dx, dy = -self.half_l, self.half_w
+        pts = ((x + dx, y + dy, 0) for x, y in self.hole_centres)
+        return obj.union(compound_from_pts(filler, pts))
 
     @property
     def _floor_raise(self):
@@ -955,19 +1005,37 @@ class GridfinityBox(GridfinityObject):
             if cf > 0:
                 cyl = cyl.edges(">Z").chamfer(cf)
 
-        # Calculate compartment centers
-        pts = []
-        for i in range(nx):
-            for j in range(ny):
-                cx = self.half_l - self.inner_l / 2 + (i + 0.5) * comp_l
-                cy = self.half_w - self.inner_w / 2 + (j + 0.5) * comp_w
-                pts.append((cx, cy, 0))
-
+        pts = self._cylinder_centres(nx, ny)
         z0 = self.floor_h + raise_h
-        cuts = composite_from_pts(cyl.translate((0, 0, z0)), pts)
+        if len(pts) == 1:
+            # Single compartment: cut the one cylinder directly
+            cx, cy, _ = pts[0]
+            return obj.cut(cyl.translate((cx, cy, z0)))
+        # Cylinders sit in separate compartments and never overlap
+        cuts = compound_from_pts(cyl, ((cx, cy, z0) for cx, cy, _ in pts))
         return obj.cut(cuts)
 
+    def _cylinder_centres(self, nx, ny):
+        """Compartment centres for cylindrical cuts, memoized on the layout."""
+        key = (nx, ny, self.inner_l, self.inner_w, self.half_l, self.half_w)
+        if self._cyl_pts_cache is None or self._cyl_pts_cache[0] != key:
+            comp_l = self.inner_l / nx
+            comp_w = self.inner_w / ny
+            x0 = self.half_l - self.inner_l / 2
+            y0 = self.half_w - self.inner_w / 2
+            xs = [x0 + (i + 0.5) * comp_l for i in range(nx)]
+            ys = [y0 + (j + 0.5) * comp_w for j in range(ny)]
+            self._cyl_pts_cache = (key, [(cx, cy, 0) for cx in xs for cy in ys])
+        return self._cyl_pts_cache[1]
+
+
+def _solid_box(length_u, width_u, height_u, **kwargs):
+    obj = GridfinityBox(length_u, width_u, height_u, **kwargs)
+    obj.solid = True
+    return obj
+
 
+@GridfinityObject.register(_solid_box)
 class GridfinitySolidBox(GridfinityBox):
     """Convenience class to represent a solid Gridfinity box."""
 
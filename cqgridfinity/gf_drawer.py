@@ -35,10 +35,14 @@ from cqgridfinity.constants import (
     GRU,
     GRU2,
 )
+from cqgridfinity.gf_helpers import union_all
 from cqgridfinity.gf_obj import GridfinityObject
 from cqkit.cq_helpers import rotate_x, rotate_y, rotate_z
 
 
+@GridfinityObject.register(
+    lambda length_u, width_u, height_u, **kwargs: GridfinityDrawerSpacer(**kwargs)
+)
 class GridfinityDrawerSpacer(GridfinityObject):
     """Gridfinity Drawer Spacers
     This class is used for making spacer elements which help fit Gridfinity baseplates
@@ -364,14 +368,10 @@ class GridfinityDrawerSpacer(GridfinityObject):
         self._obj_label = "width_spacer"
         return r
 
-    def render_full_set(self, include_baseplate=False):
-        """Renders a complete set of spacer components including the four corners plus
-        left/right and front/back spacer pairs.  The components are placed in their
-        respective installed position in the drawer so that the resulting object can
-        be used to preview final composition of components."""
+    def _full_set_parts(self, include_baseplate=False):
+        """Returns (name, object) pairs for each spacer component of the full set
+        placed in its installed position in the drawer."""
         # Four corners top/bottom left + top/bottom right
-        if not self.check_dimensions():
-            return None
         if self.front_and_back:
             bl = self.render()
             tl = rotate_x(bl, 180).translate((0, self.size[1], self.thickness))
@@ -388,16 +388,24 @@ class GridfinityDrawerSpacer(GridfinityObject):
             tr = rotate_z(tr, 180)
             tr = tr.translate((*self.size, 0))
             tr = tr.translate((-self.width_th, 0, self.thickness))
-
-        r = bl.union(tl).union(br).union(tr)
+        parts = [
+            ("Bottom Left Corner", bl),
+            ("Top Left Corner", tl),
+            ("Bottom Right Corner", br),
+            ("Top Right Corner", tr),
+        ]
         # 2x length-wise (drawer width) fillers
         if self.deep_enough:
             lf = self.render_length_filler()
-            r = r.union(lf.translate((self.size[0] / 2, self.fb_length_th / 2, 0)))
+            yo = self.fb_length_th / 2
+            parts.append(("Front Spacer", lf.translate((self.size[0] / 2, yo, 0))))
             if self.front_and_back:
-                r = r.union(
-                    lf.translate(
-                        (self.size[0] / 2, self.size[1] - self.fb_length_th / 2, 0)
+                parts.append(
+                    (
+                        "Back Spacer",
+                        lf.translate(
+                            (self.size[0] / 2, self.size[1] - self.fb_length_th / 2, 0)
+                        ),
                     )
                 )
         # 2x width-wise (drawer depth) fillers
@@ -406,19 +414,45 @@ class GridfinityDrawerSpacer(GridfinityObject):
             yo = self.size[1] / 2
             if not self.front_and_back:
                 yo += self.fb_length_th / 2
-            r = r.union(wf.translate((self.width_th / 2, yo, 0)))
-            r = r.union(wf.translate((self.size[0] - self.width_th / 2, yo, 0)))
+            parts.append(("Left Spacer", wf.translate((self.width_th / 2, yo, 0))))
+            xo = self.size[0] - self.width_th / 2
+            parts.append(("Right Spacer", wf.translate((xo, yo, 0))))
         if include_baseplate:
             from cqgridfinity.gf_baseplate import GridfinityBaseplate
             bp = GridfinityBaseplate(*self.size_u)
             rb = bp.render().translate((self.size[0] / 2, self.size[1] / 2, 0))
             if not self.front_and_back:
                 rb = rb.translate((0, self.fb_length_th / 2, 0))
-            r = r.union(rb)
+            parts.append(("Baseplate", rb))
+        return parts
+
+    def render_full_set(self, include_baseplate=False):
+        """Renders a complete set of spacer components including the four corners plus
+        left/right and front/back spacer pairs.  The components are placed in their
+        respective installed position in the drawer so that the resulting object can
+        be used to preview final composition of components."""
+        if not self.check_dimensions():
+            return None
+        parts = self._full_set_parts(include_baseplate=include_baseplate)
+        # the parts are fused together in one boolean
+        r = union_all([part for _, part in parts])
         self._cq_obj = r
         self._obj_label = "full_set"
         return r
 
+    def render_assembly(self, include_baseplate=False):
+        """Renders the full set of spacer components as a CadQuery Assembly object.
+        Each component is kept as a separate named part in its installed position,
+        so the preview is built without fusing the parts together."""
+        if not self.check_dimensions():
+            return None
+        a = cq.Assembly(name="Gridfinity Drawer Spacers")
+        for name, part in self._full_set_parts(include_baseplate=include_baseplate):
+            a.add(part, name=name)
+        self._cq_obj = a
+        self._obj_label = "full_set"
+        return a
+
     def render_half_set(self):
         """Renders half of the full set of spacer components arranged for convenience
         for 3D printing.  This resulting compound object can then be printed twice to
@@ -439,7 +473,7 @@ class GridfinityDrawerSpacer(GridfinityObject):
             xo = 2.5 * self.width_th
             yo = 0
         br = rotate_y(br, 180).translate((xo, yo, self.thickness))
-        r = bl.union(br)
+        parts = [bl, br]
         # length-wise (drawer width) filler
         if self.deep_enough:
             xl = self.length_fill / 2 - (
@@ -455,19 +489,19 @@ class GridfinityDrawerSpacer(GridfinityObject):
                 yl += max(self.fb_length_th, self.align_l / 2)
             else:
                 yl = 3.5 * self.fb_length_th
-            r = r.union(self.render_length_filler().translate((xl, yl, 0)))
+            parts.append(self.render_length_filler().translate((xl, yl, 0)))
         # width-wise (drawer depth) filler
         if self.wide_enough:
             wf = self.render_width_filler(arrows_bottom=False)
-            r = r.union(wf.translate((-self.width_th, self.width_fill / 2, 0)))
+            parts.append(wf.translate((-self.width_th, self.width_fill / 2, 0)))
             if not self.front_and_back:
-                r = r.union(
+                parts.append(
                     wf.translate((-2.5 * self.width_th, self.width_fill / 2, 0))
                 )
                 fb = self.render(arrows_bottom=False, front_and_back=False)
-                r = r.union(fb.translate((-4.5 * self.width_th, 0, 0)))
-                r = r.union(fb.translate((-6 * self.width_th, 0, 0)))
-
+                parts.append(fb.translate((-4.5 * self.width_th, 0, 0)))
+                parts.append(fb.translate((-6 * self.width_th, 0, 0)))
+        r = union_all(parts)
         self._cq_obj = r
         self._obj_label = "half_set"
         return r
@@ -23,10 +23,75 @@
 #
 # Gridfinity Helper Functions
 
+from functools import lru_cache, wraps
+from inspect import signature
+import os
+
 import cadquery as cq
 from cqkit import rotate_z
+from cqkit.cq_helpers import rounded_rect_sketch
+
+# Set CQGF_NO_RENDER_CACHE to build every shape afresh, e.g. when timing
+# renders. Every module-level shape cache is then disabled.
+NO_RENDER_CACHE = "CQGF_NO_RENDER_CACHE" in os.environ
+
+# clear() functions of all module-level caches, called by clear_caches()
+_CACHE_CLEARERS = []
+
+
+def register_cache(cache):
+    """Registers a module-level cache, either a dict or an lru_cache wrapped
+    function, so that clear_caches() empties it. Returns the cache, so it can
+    also be used as a decorator."""
+    _CACHE_CLEARERS.append(getattr(cache, "cache_clear", None) or cache.clear)
+    return cache
+
+
+def shape_cache(maxsize=128):
+    """lru_cache for module-level shape builders. The cache is registered
+    with clear_caches() and is disabled when CQGF_NO_RENDER_CACHE is set."""
+
+    def decorator(func):
+        size = 0 if NO_RENDER_CACHE else maxsize
+        return register_cache(lru_cache(maxsize=size)(func))
+
+    return decorator
+
+
+def clear_caches():
+    """Empties every registered module-level cache."""
+    for clear in _CACHE_CLEARERS:
+        clear()
+
+
+def cached_primitive(func):
+    """Memoize a primitive solid by its arguments.
+
+    Primitives such as hole tools and alignment features are requested many
+    times with the same few argument tuples. The solid is built once per
+    process and shared; each call returns a fresh Workplane wrapping it so
+    callers can chain operations without affecting the cached shape.
+    Arguments are bound to the signature with defaults filled in, so calls
+    which spell out default values share the cache entry of bare calls.
+    """
+    sig = signature(func)
 
+    @shape_cache(maxsize=128)
+    def build(*args):
+        return func(*args).val()
 
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return cq.Workplane("XY").newObject([build(*bound.args)])
+
+    wrapper.cache_clear = build.cache_clear
+    wrapper.cache_info = build.cache_info
+    return wrapper
+
+
+@cached_primitive
 def quarter_circle(
     outer_rad, inner_rad, height, quad="tr", chamf=0.5, chamf_face=">Z", ext=0
 ):
@@ -58,6 +123,7 @@ def quarter_circle(
     return r
 
 
+@cached_primitive
 def chamf_cyl(rad, height, chamf=0.5):
     """Chamfered cylinder."""
     r = cq.Workplane("XY").circle(rad).extrude(height)
@@ -66,6 +132,7 @@ def chamf_cyl(rad, height, chamf=0.5):
     return r
 
 
+@cached_primitive
 def chamf_rect(length, width, height, angle=0, tol=0.5, z_offset=0):
     """Chamfer rectangular box"""
     if not z_offset > 0:
@@ -75,3 +142,38 @@ def chamf_rect(length, width, height, angle=0, tol=0.5, z_offset=0):
     r = cq.Workplane("XY").rect(length, width).extrude(height)
     r = r.faces(">Z").chamfer(0.5).translate((0, 0, z_offset))
     return rotate_z(r, angle)
+
+
+def compound_from_pts(obj, pts):
+    """Places copies of a shape at each (x, y) or (x, y, z) point as one compound.
+
+    pts can be any iterable of points, including a generator, and is only
+    consumed once.
+
+    Unlike cqkit's composite_from_pts(), the copies are not fused together.
+    Use it for tools that do not overlap each other, so that they can be cut
+    from a part in a single boolean operation."""
+    shape = obj.val() if isinstance(obj, cq.Workplane) else obj
+    return cq.Compound.makeCompound(
+        [shape.moved(cq.Location(cq.Vector(*pt))) for pt in pts]
+    )
+
+
+def union_all(objs):
+    """Fuses workplanes or shapes together in a single boolean operation.
+
+    Equivalent to chaining union() over objs, but all pieces are passed to
+    one multi-argument fuse, so the intersections are found in one pass."""
+    shapes = [o.val() if isinstance(o, cq.Workplane) else o for o in objs]
+    r = shapes[0].fuse(*shapes[1:]).clean() if len(shapes) > 1 else shapes[0]
+    return cq.Workplane("XY").add(r)
+
+
+@shape_cache(maxsize=32)
+def cached_rr_sketch(length, width, rad):
+    """Rounded rectangle sketch, built once per (length, width, rad).
+
+    The same grid cell sketches are extruded on every render. placeSketch()
+    copies the sketch it is given, so the shared instance must only ever be
+    placed, never edited in place with further Sketch calls."""
+    return rounded_rect_sketch(length, width, rad)
@@ -36,8 +36,8 @@
 
 import math
 
+from OCP.BOPAlgo import BOPAlgo_Options
 import cadquery as cq
-from cqkit.cq_helpers import composite_from_pts
 
 from cqgridfinity.constants import (
     EPS,
@@ -54,6 +54,13 @@ from cqgridfinity.constants import (
     GR_REFINED_HOLE_H,
     GR_SCREW_DEPTH,
 )
+from cqgridfinity.gf_helpers import cached_primitive, compound_from_pts, shape_cache
+
+# CadQuery requests parallel execution on each boolean it builds itself.
+# Also switch on OCCT's process-wide default so that booleans created inside
+# other OCCT algorithms run on the thread pool too; plate-with-many-holes
+# cuts are the case that benefits most.
+BOPAlgo_Options.SetParallelMode_s(True)
 
 
 # ---------------------------------------------------------------------------
@@ -61,6 +68,7 @@ from cqgridfinity.constants import (
 # ---------------------------------------------------------------------------
 
 
+@cached_primitive
 def magnet_hole(diameter: float = GR_HOLE_D, depth: float = GR_HOLE_H) -> cq.Workplane:
     """Create a cylindrical magnet recess solid for boolean cutting.
 
@@ -74,6 +82,7 @@ def magnet_hole(diameter: float = GR_HOLE_D, depth: float = GR_HOLE_H) -> cq.Wor
     return cq.Workplane("XY").circle(diameter / 2).extrude(depth + EPS)
 
 
+@cached_primitive
 def screw_hole(diameter: float = GR_BOLT_D, depth: float = GR_SCREW_DEPTH) -> cq.Workplane:
     """Create a cylindrical screw through-hole solid for boolean cutting.
 
@@ -87,6 +96,7 @@ def screw_hole(diameter: float = GR_BOLT_D, depth: float = GR_SCREW_DEPTH) -> cq
     return cq.Workplane("XY").circle(diameter / 2).extrude(depth + EPS)
 
 
+@cached_primitive
 def hole_filler(
     hole_diam: float = GR_HOLE_D, slice_height: float = GR_HOLE_SLICE
 ) -> cq.Workplane:
@@ -102,9 +112,14 @@ def hole_filler(
     Returns:
         CadQuery Workplane compound solid (two slabs at GR_HOLE_H height).
     """
-    rc = cq.Workplane("XY").rect(hole_diam / 2, hole_diam).extrude(slice_height)
     xo = hole_diam / 2
-    return composite_from_pts(rc, [(-xo, 0, GR_HOLE_H), (xo, 0, GR_HOLE_H)])
+    sk = cq.Sketch().push([(-xo, 0), (xo, 0)]).rect(hole_diam / 2, hole_diam)
+    return (
+        cq.Workplane("XY")
+        .placeSketch(sk)
+        .extrude(slice_height)
+        .translate((0, 0, GR_HOLE_H))
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +127,7 @@ def hole_filler(
 # ---------------------------------------------------------------------------
 
 
+@cached_primitive
 def refined_magnet_hole(
     diameter: float = GR_REFINED_HOLE_D,
     depth: float = GR_REFINED_HOLE_H,
@@ -132,6 +148,7 @@ def refined_magnet_hole(
     return cq.Workplane("XY").circle(diameter / 2).extrude(depth + EPS)
 
 
+@cached_primitive
 def crush_rib_magnet_hole(
     diameter: float = GR_HOLE_D,
     depth: float = GR_HOLE_H,
@@ -166,30 +183,20 @@ def crush_rib_magnet_hole(
     rib_arc = 2 * math.pi * outer_r / rib_count
     rib_width = rib_arc * 0.3  # thin ribs, ~30% of arc spacing
 
-    # Main cylinder (the full hole)
-    hole = cq.Workplane("XY").circle(outer_r).extrude(depth + EPS)
-
-    # Create rib material solids — these are subtracted from the cutting tool
-    # so they remain as material (protrusions) when the hole is cut
-    shapes = []
-    for i in range(rib_count):
-        angle = i * (360.0 / rib_count)
-        rib = (
-            cq.Workplane("XY")
-            .center(inner_r + rib_radial / 2, 0)
-            .rect(rib_radial, rib_width)
-            .extrude(depth + EPS)
-        )
-        if angle != 0:
-            rib = rib.rotate((0, 0, 0), (0, 0, 1), angle)
-        shapes.append(rib.val())
-
-    rib_compound = cq.Compound.makeCompound(shapes)
-    ribs = cq.Workplane("XY").newObject([rib_compound])
-
-    return hole.cut(ribs)
+    # The hole profile is the full circle with the rib footprints removed.
+    # Ribs are laid out as a rotated polar array in a single sketch, so the
+    # tool is one extrusion with no 3D boolean work. Rib notches remain as
+    # material (protrusions) when the tool is cut from a part.
+    profile = (
+        cq.Sketch()
+        .circle(outer_r)
+        .parray(inner_r + rib_radial / 2, 0, 360, rib_count)
+        .rect(rib_radial, rib_width, mode="s")
+    )
+    return cq.Workplane("XY").placeSketch(profile).extrude(depth + EPS)
 
 
+@cached_primitive
 def _chamfer_cone(
     hole_radius: float,
     chamfer_extra_r: float = GR_CHAMFER_EXTRA_R,
@@ -211,24 +218,66 @@ def _chamfer_cone(
     """
     chamfer_h = chamfer_extra_r / math.tan(math.radians(chamfer_angle))
     top_r = hole_radius + chamfer_extra_r
+    # Revolve the half cross-section about the Z axis (local Y of the XZ
+    # plane); much cheaper than lofting between two circles.
     return (
-        cq.Workplane("XY")
-        .circle(top_r)
-        .workplane(offset=chamfer_h)
-        .circle(hole_radius)
-        .loft()
+        cq.Workplane("XZ")
+        .moveTo(0, 0)
+        .lineTo(top_r, 0)
+        .lineTo(hole_radius, chamfer_h)
+        .lineTo(0, chamfer_h)
+        .close()
+        .revolve(360, (0, 0, 0), (0, 1, 0))
     )
 
 
+@cached_primitive
+def _chamfered_magnet_hole(
+    hole_radius: float,
+    depth: float,
+    chamfer_extra_r: float = GR_CHAMFER_EXTRA_R,
+    chamfer_angle: float = GR_CHAMFER_ANGLE,
+) -> cq.Workplane:
+    """Create a plain magnet hole and its entry chamfer as one solid.
+
+    Equivalent to magnet_hole() fused with _chamfer_cone() placed at Z=depth,
+    but built by revolving the combined stepped profile so that no loft or
+    boolean is needed.
+
+    Args:
+        hole_radius: Hole radius.
+        depth: Hole depth (the chamfer starts at this height).
+        chamfer_extra_r: Additional radius at cone base (default 0.8mm).
+        chamfer_angle: Chamfer angle in degrees (default 45°).
+
+    Returns:
+        CadQuery Workplane solid at origin, extruding in +Z.
+    """
+    chamfer_h = chamfer_extra_r / math.tan(math.radians(chamfer_angle))
+    return (
+        cq.Workplane("XZ")
+        .moveTo(0, 0)
+        .lineTo(hole_radius, 0)
+        .lineTo(hole_radius, depth)
+        .lineTo(hole_radius + chamfer_extra_r, depth)
+        .lineTo(hole_radius, depth + chamfer_h)
+        .lineTo(0, depth + chamfer_h)
+        .close()
+        .revolve(360, (0, 0, 0), (0, 1, 0))
+    )
+
+
+@cached_primitive
 def _printable_bridge(
     hole_radius: float,
     bridge_height: float = 0.4,
 ) -> cq.Workplane:
     """Create a thin bridge disc for FDM-printable hole tops.
 
-    This disc is subtracted from the cutting tool so that a thin layer
-    of material remains at the top of the hole, allowing the slicer to
-    print a bridge layer without supports.
+    The disc is the thin layer of material left at the top of the hole,
+    allowing the slicer to print a bridge layer without supports.
+    enhanced_magnet_hole() produces the same result by stopping the cutting
+    tool short by bridge_height rather than subtracting this disc.
 
     Args:
         hole_radius: Radius of the hole being bridged.
@@ -270,27 +319,165 @@ def enhanced_magnet_hole(
     h = GR_REFINED_HOLE_H if refined else depth
     r = d / 2
 
+    # Printable bridge top: stop the cutting tool a thin layer short of the
+    # hole top so that material remains as a bridge layer. Shortening the
+    # extrusion avoids cutting a bridge disc back out of a full-depth tool.
+    bridge_h = 0.4 if printable_top else 0  # ~2 print layers at 0.2mm
+
+    # A plain round hole with an attached chamfer is a single solid of
+    # revolution
+    if chamfer and not crush_ribs and not printable_top:
+        return _chamfered_magnet_hole(r, h)
+
     # Base hole (with or without crush ribs)
     if crush_ribs:
-        hole = crush_rib_magnet_hole(d, h)
+        hole = crush_rib_magnet_hole(d, h - bridge_h)
     else:
-        hole = magnet_hole(d, h)
+        hole = magnet_hole(d, h - bridge_h)
 
-    # Entry chamfer at the top of the hole
+    # Entry chamfer at the top of the hole. Above a printable bridge the cone
+    # is separate from the hole, so the two are simply grouped; a ribbed hole
+    # overlaps the cone and needs one fuse.
     if chamfer:
         cone = _chamfer_cone(r).translate((0, 0, h))
-        hole = hole.union(cone)
-
-    # Printable bridge top: remove a thin disc from the cutting tool at the
-    # hole top so that material remains as a bridge layer
-    if printable_top:
-        bridge_h = 0.4  # ~2 print layers at 0.2mm
-        bridge = _printable_bridge(r, bridge_h).translate((0, 0, h - bridge_h))
-        hole = hole.cut(bridge)
+        if printable_top:
+            tool = cq.Compound.makeCompound([hole.val(), cone.val()])
+            hole = cq.Workplane("XY").newObject([tool])
+        else:
+            hole = hole.union(cone)
 
     return hole
 
 
+# ---------------------------------------------------------------------------
+# Cached cutting tools
+# ---------------------------------------------------------------------------
+#
+# The cut functions below are called with a small set of parameter
+# combinations (almost always the module defaults), so each distinct tool
+# solid is built once per process and then placed with compound_from_pts(),
+# which only attaches a location to the shared shape for each hole. Plain
+# magnet and screw tools come straight from the cached primitives; the
+# composite enhanced tool is cached here. Tools are always built at the
+# origin and the z offset is applied with the per-point location, so the
+# cached shape is never translated.
+
+
+@shape_cache(maxsize=None)
+def _enhanced_tool(
+    diameter: float,
+    depth: float,
+    refined: bool,
+    crush_ribs: bool,
+    chamfer: bool,
+    printable_top: bool,
+    include_screw: bool,
+    screw_diameter: float,
+    screw_depth: float,
+) -> cq.Shape:
+    hole = enhanced_magnet_hole(
+        diameter=diameter,
+        depth=depth,
+        refined=refined,
+        crush_ribs=crush_ribs,
+        chamfer=chamfer,
+        printable_top=printable_top,
+    )
+    if include_screw:
+        hole = hole.union(screw_hole(screw_diameter, screw_depth))
+    return hole.val()
+
+
+@shape_cache(maxsize=None)
+def _stacked_tool(
+    diameter: float,
+    depth: float,
+    refined: bool,
+    crush_ribs: bool,
+    chamfer: bool,
+    printable_top: bool,
+    magnet_z_offset: float,
+    screw_diameter: float,
+    screw_depth: float,
+) -> cq.Shape:
+    mag = _enhanced_tool(
+        diameter,
+        depth,
+        refined,
+        crush_ribs,
+        chamfer,
+        printable_top,
+        False,
+        GR_BOLT_D,
+        GR_SCREW_DEPTH,
+    )
+    mag = mag.moved(cq.Location(cq.Vector(0, 0, magnet_z_offset)))
+    return screw_hole(screw_diameter, screw_depth).union(mag).val()
+
+
+def _morton_key(pt):
+    """Z-order (Morton) key of an (x, y, ...) point quantised to 1/16 mm."""
+    ix = (int(round(pt[0] * 16)) + 0x8000) & 0xFFFF
+    iy = (int(round(pt[1] * 16)) + 0x8000) & 0xFFFF
+    key = 0
+    for bit in range(16):
+        key |= ((ix >> bit) & 1) << (2 * bit)
+        key |= ((iy >> bit) & 1) << (2 * bit + 1)
+    return key
+
+
+def _cut_at_points(obj, tool, pts, num_divisions=1):
+    """Cut copies of tool placed at each (x, y, z) point from obj.
+
+    With num_divisions=1 all copies are subtracted in a single boolean.
+    For larger values the object's XY extent is split into a
+    num_divisions x num_divisions grid of tiles; each tile is intersected out
+    of the object, cut with only the tools that reach into it, and the tiles
+    are fused back together. This bounds the work done by each boolean on
+    very large plates at the cost of the extra intersect/fuse steps.
+    """
+    # Spatially coherent tool order keeps neighbouring holes together in
+    # the compound, which helps the boolean's bounding box pairing
+    pts = sorted(pts, key=_morton_key)
+    if num_divisions <= 1:
+        return obj.cut(compound_from_pts(tool, pts))
+    n = int(num_divisions)
+    bb = obj.val().BoundingBox()
+    tw, th = bb.xlen / n, bb.ylen / n
+    tool_bb = (tool.val() if isinstance(tool, cq.Workplane) else tool).BoundingBox()
+    # A tool reaches every tile its footprint overlaps, not just the tile
+    # holding its centre
+    buckets = {}
+    for pt in pts:
+        x0 = pt[0] + tool_bb.xmin - bb.xmin
+        x1 = pt[0] + tool_bb.xmax - bb.xmin
+        y0 = pt[1] + tool_bb.ymin - bb.ymin
+        y1 = pt[1] + tool_bb.ymax - bb.ymin
+        for i in range(max(0, int(x0 // tw)), min(n - 1, int(x1 // tw)) + 1):
+            for j in range(max(0, int(y0 // th)), min(n - 1, int(y1 // th)) + 1):
+                buckets.setdefault((i, j), []).append(pt)
+    r = None
+    for i in range(n):
+        for j in range(n):
+            tile = (
+                cq.Workplane("XY")
+                .rect(tw, th)
+                .extrude(bb.zlen + 2 * EPS)
+                .translate(
+                    (
+                        bb.xmin + (i + 0.5) * tw,
+                        bb.ymin + (j + 0.5) * th,
+                        bb.zmin - EPS,
+                    )
+                )
+            )
+            piece = obj.intersect(tile)
+            if (i, j) in buckets:
+                piece = piece.cut(compound_from_pts(tool, buckets[(i, j)]))
+            r = piece if r is None else r.union(piece)
+    return r
+
+
 # ---------------------------------------------------------------------------
 # High-level cut functions (used by baseplates and bins)
 # ---------------------------------------------------------------------------
@@ -302,6 +489,7 @@ def cut_magnet_holes(
     z_offset: float = 0,
     diameter: float = GR_HOLE_D,
     depth: float = GR_HOLE_H,
+    num_divisions: int = 1,
 ) -> cq.Workplane:
     """Cut magnet recesses into an object at the given XY positions.
 
@@ -311,13 +499,16 @@ def cut_magnet_holes(
         z_offset: Z position of the bottom of the magnet recess.
         diameter: Magnet hole diameter.
         depth: Magnet hole depth.
+        num_divisions: Split the cut into an n x n grid of tiles (default 1,
+            a single boolean). Only worthwhile for very large plates.
 
     Returns:
         CadQuery Workplane with holes cut.
     """
-    mag = magnet_hole(diameter, depth).translate((0, 0, z_offset))
-    holes = composite_from_pts(mag, [(x, y, 0) for x, y in points])
-    return obj.cut(holes)
+    if len(points) == 0:
+        return obj
+    pts = [(x, y, z_offset) for x, y in points]
+    return _cut_at_points(obj, magnet_hole(diameter, depth), pts, num_divisions)
 
 
 def cut_screw_holes(
@@ -325,6 +516,7 @@ def cut_screw_holes(
     points: list,
     depth: float = GR_SCREW_DEPTH,
     diameter: float = GR_BOLT_D,
+    num_divisions: int = 1,
 ) -> cq.Workplane:
     """Cut screw through-holes into an object at the given XY positions.
 
@@ -333,13 +525,16 @@ def cut_screw_holes(
         points: List of (x, y) tuples for hole centre positions.
         depth: Depth of screw holes from Z=0.
         diameter: Screw hole diameter.
+        num_divisions: Split the cut into an n x n grid of tiles (default 1,
+            a single boolean).
 
     Returns:
         CadQuery Workplane with holes cut.
     """
-    screw = screw_hole(diameter, depth)
-    holes = composite_from_pts(screw, [(x, y, 0) for x, y in points])
-    return obj.cut(holes)
+    if len(points) == 0:
+        return obj
+    pts = [(x, y, 0) for x, y in points]
+    return _cut_at_points(obj, screw_hole(diameter, depth), pts, num_divisions)
 
 
 def cut_enhanced_holes(
@@ -355,12 +550,14 @@ def cut_enhanced_holes(
     include_screw: bool = False,
     screw_diameter: float = GR_BOLT_D,
     screw_depth: float = GR_SCREW_DEPTH,
+    num_divisions: int = 1,
 ) -> cq.Workplane:
     """Cut enhanced magnet holes into an object at the given XY positions.
 
     Uses enhanced_magnet_hole() to create the cutting tool, then places
-    copies at each point position. Optionally unions a screw hole with
-    each magnet hole before cutting (used by bins).
+    copies at each point position and cuts them all in one boolean
+    operation. Optionally unions a screw hole with each magnet hole before
+    cutting (used by bins).
 
     Args:
         obj: Target CadQuery object to cut into.
@@ -375,22 +572,111 @@ def cut_enhanced_holes(
         include_screw: Union a screw hole with each magnet hole.
         screw_diameter: Screw hole diameter (default 3.0mm for M3).
         screw_depth: Screw hole depth in mm.
+        num_divisions: Split the cut into an n x n grid of tiles (default 1,
+            a single boolean).
 
     Returns:
         CadQuery Workplane with enhanced holes cut.
     """
-    hole = enhanced_magnet_hole(
-        diameter=diameter,
-        depth=depth,
-        refined=refined,
-        crush_ribs=crush_ribs,
-        chamfer=chamfer,
-        printable_top=printable_top,
+    if len(points) == 0:
+        return obj
+    # Normalise arguments that don't affect the tool shape so that the z
+    # offset and unused options never produce distinct cache entries
+    if refined:
+        diameter, depth = GR_REFINED_HOLE_D, GR_REFINED_HOLE_H
+    if not include_screw:
+        screw_diameter, screw_depth = GR_BOLT_D, GR_SCREW_DEPTH
+    tool = _enhanced_tool(
+        diameter,
+        depth,
+        refined,
+        crush_ribs,
+        chamfer,
+        printable_top,
+        include_screw,
+        screw_diameter,
+        screw_depth,
     )
-    if include_screw:
-        bolt = screw_hole(screw_diameter, screw_depth)
-        hole = hole.union(bolt).translate((0, 0, z_offset))
-    else:
-        hole = hole.translate((0, 0, z_offset))
-    holes = composite_from_pts(hole, [(x, y, 0) for x, y in points])
-    return obj.cut(holes)
+    pts = [(x, y, z_offset) for x, y in points]
+    return _cut_at_points(obj, tool, pts, num_divisions)
+
+
+def cut_holes_batched(
+    obj: cq.Workplane,
+    points: list,
+    magnet_z_offset: float = None,
+    screw_depth: float = None,
+    diameter: float = GR_HOLE_D,
+    depth: float = GR_HOLE_H,
+    refined: bool = False,
+    crush_ribs: bool = False,
+    chamfer: bool = False,
+    printable_top: bool = False,
+    screw_diameter: float = GR_BOLT_D,
+    num_divisions: int = 1,
+) -> cq.Workplane:
+    """Cut magnet recesses and screw holes at the same positions in one boolean.
+
+    Equivalent to calling cut_enhanced_holes() followed by cut_screw_holes(),
+    but each magnet recess and the screw hole below it are merged into a
+    single cached tool, so the object is cut only once.
+
+    Args:
+        obj: Target CadQuery object to cut into.
+        points: List of (x, y) tuples for hole centre positions.
+        magnet_z_offset: Z position of the bottom of the magnet recess, or
+            None for no magnet recesses.
+        screw_depth: Depth of screw holes from Z=0, or None for no screw holes.
+        diameter: Standard hole diameter (used if refined=False).
+        depth: Standard hole depth (used if refined=False).
+        refined: Use refined hole dimensions.
+        crush_ribs: Add crush ribs.
+        chamfer: Add entry chamfer.
+        printable_top: Add printable bridge layer.
+        screw_diameter: Screw hole diameter (default 3.0mm for M3).
+        num_divisions: Split the cut into an n x n grid of tiles (default 1,
+            a single boolean).
+
+    Returns:
+        CadQuery Workplane with holes cut.
+    """
+    if len(points) == 0:
+        return obj
+    if screw_depth is None:
+        if magnet_z_offset is None:
+            return obj
+        return cut_enhanced_holes(
+            obj,
+            points,
+            z_offset=magnet_z_offset,
+            diameter=diameter,
+            depth=depth,
+            refined=refined,
+            crush_ribs=crush_ribs,
+            chamfer=chamfer,
+            printable_top=printable_top,
+            num_divisions=num_divisions,
+        )
+    if magnet_z_offset is None:
+        return cut_screw_holes(
+            obj,
+            points,
+            depth=screw_depth,
+            diameter=screw_diameter,
+            num_divisions=num_divisions,
+        )
+    if refined:
+        diameter, depth = GR_REFINED_HOLE_D, GR_REFINED_HOLE_H
+    tool = _stacked_tool(
+        diameter,
+        depth,
+        refined,
+        crush_ribs,
+        chamfer,
+        printable_top,
+        magnet_z_offset,
+        screw_diameter,
+        screw_depth,
+    )
+    pts = [(x, y, 0) for x, y in points]
+    return _cut_at_points(obj, tool, pts, num_divisions)
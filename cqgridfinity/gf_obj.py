@@ -23,10 +23,15 @@
 #
 # Gridfinity base object class
 
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+import hashlib
 import math
 import os
+import re
 import warnings
 
+from OCP.BinTools import BinTools
 from OCP.BRepMesh import BRepMesh_IncrementalMesh
 from OCP.StlAPI import StlAPI_Writer
 import cadquery as cq
@@ -42,17 +47,88 @@ from cqgridfinity.constants import (
     GRHU,
     SQRT2,
 )
+from cqgridfinity.gf_helpers import NO_RENDER_CACHE, clear_caches, register_cache
 from cqkit import export_step_file
 
-# Special test to see which version of CadQuery is installed and
-# therefore if any compensation is required for extruded zlen
+
+def _cq_version():
+    try:
+        return tuple(
+            int(re.match(r"\d+", p).group()) for p in cq.__version__.split(".")[:3]
+        )
+    except (AttributeError, TypeError):
+        return None
+
+
+# Check which version of CadQuery is installed and therefore if any
+# compensation is required for extruded zlen
 # CQ versions < 2.4.0 typically require zlen correction, i.e.
 # scaling the vertical extrusion extent by 1/cos(taper)
-ZLEN_FIX = True
-_r = cq.Workplane("XY").rect(2, 2).extrude(1, taper=45)
-_bb = _r.vals()[0].BoundingBox()
-if abs(_bb.zlen - 1.0) < 1e-3:
-    ZLEN_FIX = False
+# If the version can't be parsed, or CQGF_VERIFY_ZLEN is set, a trial
+# tapered extrusion is measured instead.
+_cq_ver = _cq_version()
+if _cq_ver is not None and "CQGF_VERIFY_ZLEN" not in os.environ:
+    ZLEN_FIX = _cq_ver < (2, 4, 0)
+else:
+    ZLEN_FIX = True
+    _r = cq.Workplane("XY").rect(2, 2).extrude(1, taper=45)
+    _bb = _r.vals()[0].BoundingBox()
+    if abs(_bb.zlen - 1.0) < 1e-3:
+        ZLEN_FIX = False
+
+# Derived dimensions cached per object with cached_property. They only
+# depend on public attributes, so assigning any public attribute drops them.
+_CACHED_DIMS = (
+    "length",
+    "width",
+    "height",
+    "outer_l",
+    "outer_w",
+    "outer_dim",
+    "half_l",
+    "half_w",
+    "half_dim",
+    "outer_rad",
+    "grid_centres",
+    "hole_centres",
+)
+
+
+@lru_cache(maxsize=None)
+def _source_digest():
+    """Digest of this package's sources, so saved-file hashes track the code."""
+    h = hashlib.blake2b(digest_size=16)
+    pkg = os.path.dirname(os.path.abspath(__file__))
+    for fn in sorted(os.listdir(pkg)):
+        if fn.endswith(".py"):
+            with open(os.path.join(pkg, fn), "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+# Object factories used by GridfinityObject.as_obj(), keyed by class and
+# populated with the GridfinityObject.register() decorator
+_FACTORIES = {}
+
+# Rendered shapes shared between objects with identical parameters, most
+# recently used last. Used by the cq_obj property. Like every module-level
+# shape cache, it is disabled by CQGF_NO_RENDER_CACHE (see gf_helpers).
+_RENDER_CACHE = register_cache(OrderedDict())
+_RENDER_CACHE_SIZE = 0 if NO_RENDER_CACHE else 32
+
+# One STL writer reused by every save_stl_file() call; it holds no per-shape
+# state, only its ASCII/binary mode, which is left at the OCCT default
+_STL_WRITER = StlAPI_Writer()
+
+
+def clear_render_cache():
+    """Drops every cached shape, so that the next renders start from scratch.
+
+    This empties all module-level caches: renders shared between objects via
+    cq_obj, bin cell solids, baseplate receptacle plates and cell positions,
+    hole tools and other primitives, and sketches. Setting the
+    CQGF_NO_RENDER_CACHE environment variable disables the same caches."""
+    clear_caches()
 
 
 class GridfinityObject:
@@ -77,11 +153,37 @@ class GridfinityObject:
                     stacklevel=2,
                 )
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            for k in _CACHED_DIMS:
+                self.__dict__.pop(k, None)
+
+    def _cache_key(self):
+        """Hashable snapshot of this object's type and public attributes."""
+        return (type(self).__name__,) + tuple(
+            (k, repr(v))
+            for k, v in sorted(self.__dict__.items())
+            if not k.startswith("_") and k not in _CACHED_DIMS
+        )
+
     @property
     def cq_obj(self):
-        if self._cq_obj is None:
-            return self.render()
-        return self._cq_obj
+        if self._cq_obj is not None:
+            return self._cq_obj
+        key = self._cache_key()
+        if key in _RENDER_CACHE:
+            _RENDER_CACHE.move_to_end(key)
+            # Only the shapes are shared; each object gets its own Workplane
+            # so that workplane state such as tags never leaks between them
+            return cq.Workplane("XY").newObject(_RENDER_CACHE[key])
+        r = self.render()
+        if not isinstance(r, cq.Workplane):
+            return r
+        _RENDER_CACHE[key] = r.vals()
+        if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+            _RENDER_CACHE.popitem(last=False)
+        return r
 
     @property
     def _gru(self):
@@ -94,81 +196,79 @@ class GridfinityObject:
         """
         return GRU
 
-    @property
+    @cached_property
     def length(self):
         return self.length_u * self._gru
 
-    @property
+    @cached_property
     def width(self):
         return self.width_u * self._gru
 
-    @property
+    @cached_property
     def height(self):
         # 3.8 = GR_BASE_HEIGHT (4.75) - GR_WALL (1.0) + GR_BASE_CLR (0.05)
         # This is the offset from the base profile top to where stacking units begin.
         # Inherited from upstream cq-gridfinity; produces correct total heights.
         return 3.8 + GRHU * self.height_u
 
-    @property
+    @cached_property
     def outer_l(self):
         return self.length_u * self._gru - GR_TOL
 
-    @property
+    @cached_property
     def outer_w(self):
         return self.width_u * self._gru - GR_TOL
 
-    @property
+    @cached_property
     def outer_dim(self):
         return self.outer_l, self.outer_w
 
-    @property
+    @cached_property
     def half_l(self):
         # (n-1) * _gru/2: the distance from the first grid-centre to the outer
         # shell centre.  Algebraically equal to (n*_gru - _gru)/2 for any
         # positive n including non-integers (1B.12) and half-grid (1B.13).
         return (self.length_u - 1) * self._gru / 2
 
-    @property
+    @cached_property
     def half_w(self):
         return (self.width_u - 1) * self._gru / 2
 
-    @property
+    @cached_property
     def half_dim(self):
         return self.half_l, self.half_w
 
-    @property
+    @cached_property
     def outer_rad(self):
         return GR_RAD - GR_TOL / 2
 
-    @property
+    @cached_property
     def grid_centres(self):
         gru = self._gru
-        return [
+        return tuple(
             (x * gru, y * gru)
             for x in range(math.floor(self.length_u))
             for y in range(math.floor(self.width_u))
-        ]
+        )
 
-    @property
+    @cached_property
     def hole_centres(self):
         gru = self._gru
-        return [
-            (x * gru - GR_HOLE_DIST * i, -(y * gru - GR_HOLE_DIST * j))
-            for x in range(math.floor(self.length_u))
-            for y in range(math.floor(self.width_u))
-            for i in (-1, 1)
-            for j in (-1, 1)
+        xs = [x * gru for x in range(math.floor(self.length_u))]
+        ys = [-y * gru for y in range(math.floor(self.width_u))]
+        offsets = [
+            (-GR_HOLE_DIST * i, GR_HOLE_DIST * j) for i in (-1, 1) for j in (-1, 1)
         ]
+        return tuple((x + dx, y + dy) for x in xs for y in ys for dx, dy in offsets)
 
     def safe_fillet(self, obj, selector, rad):
-        if len(obj.edges(selector).vals()) > 0:
-            try:
-                return obj.edges(selector).fillet(rad)
-            except Exception:
-                # Fillet may fail on complex geometry (raised floors,
-                # positioned labels, etc.); skip gracefully
-                return obj
-        return obj
+        try:
+            return obj.edges(selector).fillet(rad)
+        except Exception:
+            # Fillet raises when nothing matches the selector, and may fail
+            # on complex geometry (raised floors, positioned labels, etc.);
+            # skip gracefully in either case
+            return obj
 
     @property
     def _filename_prefix(self) -> str:
@@ -221,7 +321,31 @@ class GridfinityObject:
         fn += self._filename_suffix()
         return fn
 
-    def save_step_file(self, filename=None, path=None, prefix=None):
+    def _step_hash(self):
+        h = hashlib.blake2b(digest_size=16)
+        key = (self._cache_key(), cq.__version__, _source_digest())
+        h.update(repr(key).encode())
+        return h.hexdigest()
+
+    def step_file_current(self, filename):
+        """Returns True if filename was saved with skip_unchanged=True from an
+        object with identical parameters, by the same code and CadQuery version."""
+        try:
+            with open(filename + ".hash") as f:
+                h = f.read().strip()
+        except OSError:
+            return False
+        return h == self._step_hash() and os.path.isfile(filename)
+
+    def save_step_file(
+        self, filename=None, path=None, prefix=None, skip_unchanged=False
+    ):
+        """Saves the object as a STEP file.
+
+        With skip_unchanged=True a <filename>.hash sidecar is written next to
+        the STEP file, and later saves of an identical object skip rendering
+        and exporting entirely. Returns True if the file was written.
+        """
         fn = (
             filename
             if filename is not None
@@ -229,13 +353,33 @@ class GridfinityObject:
         )
         if not fn.lower().endswith(".step"):
             fn = fn + ".step"
+        if skip_unchanged and self.step_file_current(fn):
+            return False
         if isinstance(self.cq_obj, cq.Assembly):
-            self.cq_obj.save(fn)
+            try:
+                # Name the format explicitly rather than inferring it from
+                # the file extension
+                self.cq_obj.export(fn, exportType="STEP", mode="default")
+            except AttributeError:
+                # CadQuery < 2.4 only provides Assembly.save()
+                self.cq_obj.save(fn)
         else:
             export_step_file(self.cq_obj, fn)
+        if skip_unchanged:
+            tmp = fn + ".hash.tmp"
+            with open(tmp, "w") as f:
+                f.write(self._step_hash())
+            os.replace(tmp, fn + ".hash")
+        return True
 
     def save_stl_file(
-        self, filename=None, path=None, prefix=None, tol=1e-2, ang_tol=0.1
+        self,
+        filename=None,
+        path=None,
+        prefix=None,
+        tol=1e-2,
+        ang_tol=0.1,
+        parallel=True,
     ):
         fn = (
             filename
@@ -244,11 +388,34 @@ class GridfinityObject:
         )
         if not fn.lower().endswith(".stl"):
             fn = fn + ".stl"
+        obj = self._ensure_meshed(tol=tol, ang_tol=ang_tol, parallel=parallel)
+        _STL_WRITER.Write(obj, fn)
+
+    def save_brep_file(self, filename=None, path=None, prefix=None):
+        """Saves the object as an OCCT binary BRep file.
+
+        Much quicker to write and smaller than STEP, but only readable by
+        OCCT based tools; useful for inspecting intermediate results."""
+        fn = (
+            filename
+            if filename is not None
+            else self.filename(path=path, prefix=prefix)
+        )
+        if not fn.lower().endswith(".brep"):
+            fn = fn + ".brep"
+        BinTools.Write_s(self.cq_obj.val().wrapped, fn)
+
+    def _ensure_meshed(self, tol=1e-2, ang_tol=0.1, parallel=True):
+        """Triangulates the rendered shape, unless it is already meshed at
+        the same tolerances, and returns the wrapped OCP shape."""
         obj = self.cq_obj.val().wrapped
-        mesh = BRepMesh_IncrementalMesh(obj, tol, True, ang_tol, True)
-        mesh.Perform()
-        writer = StlAPI_Writer()
-        writer.Write(obj, fn)
+        mesh = self.__dict__.get("_mesh")
+        if mesh is None or mesh[0] is not obj or mesh[1] != (tol, ang_tol):
+            # The constructor meshes the shape (tol is relative to edge size);
+            # calling Perform() afterwards would mesh it a second time
+            BRepMesh_IncrementalMesh(obj, tol, True, ang_tol, parallel)
+            self._mesh = (obj, (tol, ang_tol))
+        return obj
 
     def save_svg_file(self, filename=None, path=None, prefix=None):
         fn = (
@@ -258,8 +425,13 @@ class GridfinityObject:
         )
         if not fn.lower().endswith(".svg"):
             fn = fn + ".svg"
-        r = self.cq_obj.rotate((0, 0, 0), (0, 0, 1), 75)
-        r = r.rotate((0, 0, 0), (1, 0, 0), -90)
+        # view every object on the stack through a location rather than
+        # rotating copies of them, so the shapes (and any triangulation on
+        # them) are shared
+        loc = cq.Location(cq.Vector(), cq.Vector(1, 0, 0), -90) * cq.Location(
+            cq.Vector(), cq.Vector(0, 0, 1), 75
+        )
+        r = cq.Compound.makeCompound(self.cq_obj.vals()).moved(loc)
         exporters.export(
             r,
             fn,
@@ -273,7 +445,29 @@ class GridfinityObject:
             },
         )
 
+    @staticmethod
+    def _merge_profile(profile):
+        """Combines consecutive profile levels of the same kind into one level.
+
+        Straight levels are summed with straight levels and tapered levels
+        with levels of the same taper, so that each run is extruded once.
+        """
+        levels = []
+        for level in profile:
+            if isinstance(level, (tuple, list)):
+                level = (level[0], level[1])
+                if levels and isinstance(levels[-1], tuple):
+                    if level[1] and levels[-1][1] == level[1]:
+                        levels[-1] = (levels[-1][0] + level[0], level[1])
+                        continue
+            elif levels and not isinstance(levels[-1], tuple):
+                levels[-1] += level
+                continue
+            levels.append(level)
+        return levels
+
     def extrude_profile(self, sketch, profile, workplane="XY", angle=None):
+        profile = self._merge_profile(profile)
         taper = profile[0][1] if isinstance(profile[0], (list, tuple)) else 0
         zlen = profile[0][0] if isinstance(profile[0], (list, tuple)) else profile[0]
         if abs(taper) > 0:
@@ -329,27 +523,23 @@ class GridfinityObject:
         obj = GridfinityObject.as_obj(cls, length_u, width_u, height_u, **kwargs)
         obj.save_stl_file(filename=filename, path=path, prefix=prefix)
 
+    @staticmethod
+    def register(factory):
+        """Class decorator recording how as_obj() creates objects of a class.
+
+        factory is called as factory(length_u, width_u, height_u, **kwargs).
+        Subclasses without their own factory use the nearest registered base.
+        """
+
+        def decorator(cls):
+            _FACTORIES[cls] = factory
+            return cls
+
+        return decorator
+
     @staticmethod
     def as_obj(cls, length_u=None, width_u=None, height_u=None, **kwargs):
-        # Lazy imports to avoid circular dependency at import time
-        from cqgridfinity.gf_box import GridfinityBox, GridfinitySolidBox
-        from cqgridfinity.gf_baseplate import GridfinityBaseplate
-        from cqgridfinity.gf_drawer import GridfinityDrawerSpacer
-        from cqgridfinity.gf_ruggedbox import GridfinityRuggedBox
-
-        if issubclass(cls, GridfinitySolidBox):
-            obj = GridfinityBox(length_u, width_u, height_u, **kwargs)
-            obj.solid = True
-        elif issubclass(cls, GridfinityBox):
-            obj = GridfinityBox(length_u, width_u, height_u, **kwargs)
-        elif issubclass(cls, GridfinityBaseplate):
-            obj = GridfinityBaseplate(length_u, width_u, **kwargs)
-        elif issubclass(cls, GridfinityDrawerSpacer):
-            obj = GridfinityDrawerSpacer(**kwargs)
-        elif issubclass(cls, GridfinityRuggedBox):
-            obj = GridfinityRuggedBox(length_u, width_u, height_u, **kwargs)
-        else:
-            raise TypeError(
-                "as_obj() does not support %s" % cls.__name__
-            )
-        return obj
+        for base in cls.__mro__:
+            if base in _FACTORIES:
+                return _FACTORIES[base](length_u, width_u, height_u, **kwargs)
+        raise TypeError("as_obj() does not support %s" % cls.__name__)
@@ -49,6 +49,11 @@ from cqgridfinity.gf_baseplate import GridfinityBaseplate
 from .gf_helpers import *
 
 
+@GridfinityObject.register(
+    lambda length_u, width_u, height_u, **kwargs: GridfinityRuggedBox(
+        length_u, width_u, height_u, **kwargs
+    )
+)
 class GridfinityRuggedBox(GridfinityObject):
     def __init__(self, length_u, width_u, height_u, **kwargs):
         super().__init__()
@@ -353,16 +358,19 @@ class GridfinityRuggedBox(GridfinityObject):
         r = r.edges(vs - cs).fillet(GR_RBOX_RAD).edges(cs).fillet(GR_RBOX_CRAD)
 
         if self.stackable or as_lid:
-            # bottom stacking mates
+            # bottom stacking mates, fused into one tool (they can overlap
+            # on short boxes) and cut from the body in a single boolean
+            tools = []
             for k, v in self.qtr_centres(back=not as_lid).items():
                 rq = quarter_circle(
                     GR_BREG_R0, GR_BREG_R1, GR_REG_H + 0.5, k, chamf=0, ext=0.25
                 )
-                r = r.cut(rq.translate(v))
+                tools.append(rq.translate(v).val())
             pts, rots = self.align_centres
             for pt, rot in zip(pts, rots):
                 rc = chamf_rect(GR_REG_L, GR_REG_W, GR_REG_H, angle=rot)
-                r = r.cut(rc.translate(pt))
+                tools.append(rc.translate(pt).val())
+            r = r.cut(tools[0].fuse(*tools[1:]))
 
         # chamfer top edges
         r = r.edges(">Z").chamfer(GR_RBOX_VCUT_D)
@@ -454,9 +462,12 @@ class GridfinityRuggedBox(GridfinityObject):
         r = self.extrude_profile(rs, profile)
         w = GR_RBOX_CHAN_W + 3 * GR_RBOX_WALL
         rc = cq.Workplane("XY").rect(GR_RBOX_CHAN_D, w).extrude(self.box_height)
+        # ribs can meet the body and each other, so they are collected and
+        # fused onto the body in one boolean rather than one union per rib
+        ribs = []
         if self.side_clasps:
             for pt in self.side_clasp_centres:
-                r = r.union(rc.translate(pt))
+                ribs.append(rc.translate(pt).val())
         else:
             rd = (
                 cq.Workplane("XY")
@@ -466,20 +477,24 @@ class GridfinityRuggedBox(GridfinityObject):
             xo = self.box_length / 2 + GR_RBOX_CHAN_D / 2
             yo = self.clasp_pos[1] + GR_RBOX_CHAN_W / 2 + 1.5 * GR_RBOX_WALL / 2
             for pt in [(x * xo, y * yo, 0) for x in (-1, 1) for y in (-1, 1)]:
-                r = r.union(rd.translate(pt))
+                ribs.append(rd.translate(pt).val())
         rc = rotate_z(rc, 90)
         for pt in self.front_clasp_centres:
-            r = r.union(rc.translate(pt))
+            ribs.append(rc.translate(pt).val())
         w = 1.5 * GR_RBOX_WALL
         rc = cq.Workplane("XY").rect(w, wd).extrude(self.box_height)
         for pt in self.hinge_centres:
-            r = r.union(rc.translate((pt[0] - GR_HINGE_SZ / 2 - w, pt[1] - wd / 2, 0)))
-            r = r.union(rc.translate((pt[0] + GR_HINGE_SZ / 2 + w, pt[1] - wd / 2, 0)))
+            ribs.append(
+                rc.translate((pt[0] - GR_HINGE_SZ / 2 - w, pt[1] - wd / 2, 0)).val()
+            )
+            ribs.append(
+                rc.translate((pt[0] + GR_HINGE_SZ / 2 + w, pt[1] - wd / 2, 0)).val()
+            )
         yo = self.box_width / 2 + GR_RBOX_CWALL - GR_RBOX_WALL - wd / 2
         for x in range(self.length_u):
             xo = -self.int_length / 2 + x * GRU
             if abs(xo) < (self.box_length / 2 - GR_RBOX_BACK_L):
-                r = r.union(rc.translate((xo, yo, 0)))
+                ribs.append(rc.translate((xo, yo, 0)).val())
         if not self.side_handles:
             xo = self.box_length / 2 + GR_RBOX_CWALL - GR_RBOX_WALL - wd / 2
             rc = rotate_z(rc, 90)
@@ -489,8 +504,10 @@ class GridfinityRuggedBox(GridfinityObject):
             for y in range(self.width_u):
                 yo = -self.int_width / 2 + y * GRU
                 if abs(yo) < ylim:
-                    r = r.union(rc.translate((xo, yo, 0)))
-                    r = r.union(rc.translate((-xo, yo, 0)))
+                    ribs.append(rc.translate((xo, yo, 0)).val())
+                    ribs.append(rc.translate((-xo, yo, 0)).val())
+        if ribs:
+            r = cq.Workplane("XY").add(r.val().fuse(*ribs).clean())
         hm = self.box_height - 2 * lead_height
         r = r.edges(VerticalEdgeSelector([mid_height, hm])).fillet(1)
         return r
@@ -58,6 +58,7 @@ from cqgridfinity.constants import (
 )
 from cqgridfinity.gf_box import GridfinityBox
 from cqgridfinity.gf_obj import GridfinityObject
+from cqgridfinity.gf_helpers import cached_rr_sketch, compound_from_pts, shape_cache
 
 # X-pattern arm width in mm (fraction of cell half-width)
 _X_ARM_W = 3.0
@@ -92,16 +93,27 @@ def _x_profile(arm_w=_X_ARM_W):
     return pts45, pts135
 
 
-def _x_solid(depth, arm_w=_X_ARM_W):
-    """Solid X-shaped block of given depth (height in Z).
+@shape_cache(maxsize=None)
+def _x_sketch(arm_w=_X_ARM_W):
+    """X-shaped face centred at origin; the two arms are fused in 2D.
 
-    Used both for vase shell cutouts and base insert protrusions.
-    The X is centred at origin.
+    Cached per arm width; placeSketch() copies the sketch, so the cached
+    instance is never modified.
     """
     pts45, pts135 = _x_profile(arm_w)
-    r45 = cq.Workplane("XY").polyline(pts45).close().extrude(depth)
-    r135 = cq.Workplane("XY").polyline(pts135).close().extrude(depth)
-    return r45.union(r135)
+    return cq.Sketch().polygon(pts45).polygon(pts135)
+
+
+def _x_pattern(pts, depth, arm_w=_X_ARM_W):
+    """X-shaped blocks of given depth at each (x, y, z) point.
+
+    Used both for vase shell cutouts and base insert protrusions. The X
+    sketch is placed at every point and extruded once, rather than copying
+    and fusing a pre-built solid.
+    """
+    return (
+        cq.Workplane("XY").pushPoints(pts).placeSketch(_x_sketch(arm_w)).extrude(depth)
+    )
 
 
 class GridfinityVaseBox(GridfinityBox):
@@ -217,13 +229,13 @@ class GridfinityVaseBox(GridfinityBox):
         """Grid cell positions that are on edges but not corners (style_base=2)."""
         nx = math.floor(self.length_u)
         ny = math.floor(self.width_u)
-        corners = set(self._cell_corners())
+        xb, yb = (0, nx - 1), (0, ny - 1)
+        # On exactly one boundary row/column: an edge cell, not a corner
         return [
             (x * GRU, y * GRU)
             for x in range(nx)
             for y in range(ny)
-            if (x in (0, nx - 1) or y in (0, ny - 1))
-            and (x * GRU, y * GRU) not in corners
+            if (x in xb) != (y in yb)
         ]
 
     def _x_cutout_cells(self):
@@ -252,7 +264,7 @@ class GridfinityVaseBox(GridfinityBox):
 
         # ── 1. Base profiles (same Gridfinity base as normal bins) ──────────
         base_profile = self.extrude_profile(
-            rounded_rect_sketch(self._gru, self._gru, self.outer_rad + GR_BASE_CLR),
+            cached_rr_sketch(self._gru, self._gru, self.outer_rad + GR_BASE_CLR),
             GR_BOX_PROFILE,
         )
         base_profile = base_profile.translate((0, 0, -GR_BASE_CLR))
@@ -296,8 +308,9 @@ class GridfinityVaseBox(GridfinityBox):
         # ── 4. X-cutouts through the bottom slab (style_base) ───────────────
         x_cells = self._x_cutout_cells()
         if x_cells:
-            x_solid = _x_solid(d_bottom + EPS + 0.01)
-            x_cuts = composite_from_pts(x_solid, [(cx, cy, -EPS) for cx, cy in x_cells])
+            x_cuts = _x_pattern(
+                ((cx, cy, -EPS) for cx, cy in x_cells), d_bottom + EPS + 0.01
+            )
             r = r.cut(x_cuts)
 
         # ── 5. Optional stacking lip ─────────────────────────────────────────
@@ -336,7 +349,9 @@ class GridfinityVaseBox(GridfinityBox):
                 (i * xl - self.outer_l / 2, 0)
                 for i in range(1, self.n_divx)
             ]
-            r = r.union(composite_from_pts(div_wall, div_pts))
+            # Dividers never touch each other, so the copies are added as
+            # one compound instead of being fused together first
+            r = r.union(compound_from_pts(div_wall, div_pts))
 
         # ── 7. Optional scoop chamfer (back wall bottom interior) ─────────────
         if self.enable_scoop_chamfer and bin_h > d_bottom + 1.0:
@@ -491,18 +506,18 @@ class GridfinityVaseBase(GridfinityObject):
         ny = self.width_u
         if self.style_base == 0:
             return all_cells
+        xb, yb = (0, nx - 1), (0, ny - 1)
         corners = [
             (x * GRU, y * GRU)
             for x in range(nx) for y in range(ny)
-            if (x in (0, nx - 1)) and (y in (0, ny - 1))
+            if (x in xb) and (y in yb)
         ]
         if self.style_base == 1:
             return corners
         edges = [
             (x * GRU, y * GRU)
             for x in range(nx) for y in range(ny)
-            if (x in (0, nx - 1) or y in (0, ny - 1))
-            and (x * GRU, y * GRU) not in corners
+            if (x in xb) != (y in yb)
         ]
         if self.style_base == 2:
             return edges
@@ -521,7 +536,7 @@ class GridfinityVaseBase(GridfinityObject):
 
         # ── 1. Base profiles at each grid cell ───────────────────────────────
         base_profile = self.extrude_profile(
-            rounded_rect_sketch(GRU, GRU, self.outer_rad + GR_BASE_CLR),
+            cached_rr_sketch(GRU, GRU, self.outer_rad + GR_BASE_CLR),
             GR_BOX_PROFILE,
         )
         base_profile = base_profile.translate((0, 0, -GR_BASE_CLR))
@@ -573,12 +588,14 @@ class GridfinityVaseBase(GridfinityObject):
         # ── 4. X-pattern protrusion on top (engages vase shell X-cutouts) ────
         x_cells = self._x_cutout_cells()
         if x_cells:
-            x_protrusion = _x_solid(d_bottom, arm_w=_X_ARM_W - 0.1)  # slight clearance
             # Place at each cell center in pre-transform coords; final translate
             # handles world-coord centering (avoids double-subtracting half_l/half_w).
-            for cx, cy in x_cells:
-                xp = x_protrusion.translate((cx, cy, d_bottom))
-                r = r.union(xp)
+            x_protrusions = _x_pattern(
+                ((cx, cy, d_bottom) for cx, cy in x_cells),
+                d_bottom,
+                arm_w=_X_ARM_W - 0.1,  # slight clearance
+            )
+            r = r.union(x_protrusions)
 
         # ── 5. Magnet holes ───────────────────────────────────────────────────
         if self.holes:
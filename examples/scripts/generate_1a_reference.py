@@ -5,6 +5,7 @@ Features 0.1-0.20 from documents/FEATURE-SPEC.md.
 Run with: conda run -n gridfinity python examples/scripts/generate_1a_reference.py
 """
 
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
 import time
@@ -21,15 +22,43 @@ OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "output")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+# Objects are queued by save() and section() while main() runs, then
+# rendered in parallel worker processes; output is printed in queue order.
+JOBS = []
+
+
 def save(obj, name):
-    """Render and save a STEP file, printing timing info."""
+    """Queue an object to be rendered and saved as a STEP file."""
+    JOBS.append((obj, name))
+
+
+def section(title):
+    """Queue a section heading to print between results."""
+    JOBS.append((None, title))
+
+
+def _render_and_save(job):
+    """Render and save a STEP file, returning its timing info line."""
+    obj, name = job
+    if obj is None:
+        return name
+    path = os.path.join(OUTPUT_DIR, name + ".step")
+    if obj.step_file_current(path):
+        return f"  {name}.step  (unchanged)"
     t0 = time.time()
     obj.render()
     t1 = time.time()
-    path = os.path.join(OUTPUT_DIR, name + ".step")
-    obj.save_step_file(filename=path)
+    obj.save_step_file(filename=path, skip_unchanged=True)
     t2 = time.time()
-    print(f"  {name}.step  (render {t1 - t0:.1f}s, save {t2 - t1:.1f}s)")
+    return f"  {name}.step  (render {t1 - t0:.1f}s, save {t2 - t1:.1f}s)"
+
+
+def run_jobs():
+    """Render all queued objects across CPU cores."""
+    with ProcessPoolExecutor() as ex:
+        for line in ex.map(_render_and_save, JOBS):
+            print(line, flush=True)
+    JOBS.clear()
 
 
 def main():
@@ -72,7 +101,7 @@ def main():
         "0.16_baseplate_weighted_4x3",
     )
 
-    print("\n=== BINS ===")
+    section("\n=== BINS ===")
 
     # 0.4 - Standard bin
     save(GridfinityBox(3, 2, 5), "0.04_bin_standard_3x2x5")
@@ -111,7 +140,7 @@ def main():
         "0.04-10_bin_all-features_3x2x5",
     )
 
-    print("\n=== LIP STYLES ===")
+    section("\n=== LIP STYLES ===")
 
     # 0.17 - Normal lip (default)
     save(GridfinityBox(2, 2, 3), "0.17_bin_lip-normal_2x2x3")
@@ -128,7 +157,7 @@ def main():
         "0.19_bin_lip-none_2x2x3",
     )
 
-    print("\n=== CONFIGURABLE FILLET ===")
+    section("\n=== CONFIGURABLE FILLET ===")
 
     # 0.20 - Custom interior fillet
     save(
@@ -142,6 +171,8 @@ def main():
         "0.20_bin_fillet-default_3x2x5",
     )
 
+    run_jobs()
+
     print("\n=== DONE ===")
     step_files = [f for f in os.listdir(OUTPUT_DIR) if f.endswith(".step")]
     print(f"Generated {len(step_files)} STEP files in {OUTPUT_DIR}/")
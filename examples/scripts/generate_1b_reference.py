@@ -8,6 +8,7 @@ Run with: conda run -n gridfinity python examples/scripts/generate_1b_reference.
 Output: examples/output/  (gitignored — regenerate any time)
 """
 
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
 import time
@@ -25,15 +26,43 @@ OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "output")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+# Objects are queued by save() and section() while main() runs, then
+# rendered in parallel worker processes; output is printed in queue order.
+JOBS = []
+
+
 def save(obj, name):
-    """Render and save a STEP file, printing timing info."""
+    """Queue an object to be rendered and saved as a STEP file."""
+    JOBS.append((obj, name))
+
+
+def section(title):
+    """Queue a section heading to print between results."""
+    JOBS.append((None, title))
+
+
+def _render_and_save(job):
+    """Render and save a STEP file, returning its timing info line."""
+    obj, name = job
+    if obj is None:
+        return name
+    path = os.path.join(OUTPUT_DIR, name + ".step")
+    if obj.step_file_current(path):
+        return f"  {name}.step  (unchanged)"
     t0 = time.time()
     obj.render()
     t1 = time.time()
-    path = os.path.join(OUTPUT_DIR, name + ".step")
-    obj.save_step_file(filename=path)
+    obj.save_step_file(filename=path, skip_unchanged=True)
     t2 = time.time()
-    print(f"  {name}.step  (render {t1 - t0:.1f}s, save {t2 - t1:.1f}s)")
+    return f"  {name}.step  (render {t1 - t0:.1f}s, save {t2 - t1:.1f}s)"
+
+
+def run_jobs():
+    """Render all queued objects across CPU cores."""
+    with ProcessPoolExecutor() as ex:
+        for line in ex.map(_render_and_save, JOBS):
+            print(line, flush=True)
+    JOBS.clear()
 
 
 def main():
@@ -46,21 +75,21 @@ def main():
     save(GridfinityBox(2, 2, 5, scoops=1.0), "1B05_scoop_1.0_2x2x5")
 
     # ── 1B.6: Tab positioning ────────────────────────────────────────────────
-    print("\n=== 1B.6: Tab positioning ===")
+    section("\n=== 1B.6: Tab positioning ===")
     save(GridfinityBox(3, 2, 5, label_style="full",   length_div=1), "1B06_label_full_3x2x5")
     save(GridfinityBox(3, 2, 5, label_style="left",   length_div=1), "1B06_label_left_3x2x5")
     save(GridfinityBox(3, 2, 5, label_style="center", length_div=1), "1B06_label_center_3x2x5")
     save(GridfinityBox(3, 2, 5, label_style="right",  length_div=1), "1B06_label_right_3x2x5")
 
     # ── 1B.7: Custom compartment depth ──────────────────────────────────────
-    print("\n=== 1B.7: Custom compartment depth ===")
+    section("\n=== 1B.7: Custom compartment depth ===")
     save(GridfinityBox(2, 2, 5),                             "1B07_depth_default_2x2x5")
     save(GridfinityBox(2, 2, 5, compartment_depth=5),        "1B07_depth_5mm_2x2x5")
     save(GridfinityBox(2, 2, 5, compartment_depth=10),       "1B07_depth_10mm_2x2x5")
     save(GridfinityBox(2, 2, 5, height_internal=10),         "1B07_height-internal-10mm_2x2x5")
 
     # ── 1B.8: Cylindrical compartments ──────────────────────────────────────
-    print("\n=== 1B.8: Cylindrical compartments ===")
+    section("\n=== 1B.8: Cylindrical compartments ===")
     save(GridfinityBox(1, 1, 5, cylindrical=True, cylinder_diam=30),
          "1B08_cylindrical_30mm_1x1x5")
     save(GridfinityBox(2, 2, 5, cylindrical=True, cylinder_diam=20),
@@ -70,7 +99,7 @@ def main():
          "1B08_cylindrical_20mm-div_2x2x5")
 
     # ── 1B.9: Skeletonized baseplate ─────────────────────────────────────────
-    print("\n=== 1B.9: Skeletonized baseplate ===")
+    section("\n=== 1B.9: Skeletonized baseplate ===")
     save(GridfinityBaseplate(4, 3, skeleton=True),
          "1B09_skeleton_4x3")
     save(GridfinityBaseplate(4, 3, skeleton=True, magnet_holes=True),
@@ -81,7 +110,7 @@ def main():
          "1B09_skeleton_mag-screw_4x3")
 
     # ── 1B.10: Screw-together baseplate ──────────────────────────────────────
-    print("\n=== 1B.10: Screw-together baseplate ===")
+    section("\n=== 1B.10: Screw-together baseplate ===")
     save(GridfinityBaseplate(4, 3, screw_together=True),
          "1B10_screw-together_4x3")
     save(GridfinityBaseplate(4, 3, screw_together=True, n_screws=2),
@@ -92,7 +121,7 @@ def main():
          "1B10_skeleton-screw-together_4x3")
 
     # ── 1B.11: Fit-to-drawer baseplate ───────────────────────────────────────
-    print("\n=== 1B.11: Fit-to-drawer baseplate ===")
+    section("\n=== 1B.11: Fit-to-drawer baseplate ===")
     save(GridfinityBaseplate(0, 0, distancex=200, distancey=150),
          "1B11_fit-to-drawer_200x150mm")
     save(GridfinityBaseplate(0, 0, distancex=200, distancey=150, fitx=-1),
@@ -103,32 +132,32 @@ def main():
          "1B11_fit-to-drawer_explicit-3x2_200mm")
 
     # ── 1B.12: Non-integer grid sizes ────────────────────────────────────────
-    print("\n=== 1B.12: Non-integer grid sizes ===")
+    section("\n=== 1B.12: Non-integer grid sizes ===")
     save(GridfinityBox(2.5, 3, 4),              "1B12_nonint_2p5x3x4")
     save(GridfinityBox(1.5, 2, 3),              "1B12_nonint_1p5x2x3")
     save(GridfinityBox(2.5, 2, 4, holes=True),  "1B12_nonint_2p5x2x4_mag")
 
     # ── 1B.13: Half-grid 21mm mode ───────────────────────────────────────────
-    print("\n=== 1B.13: Half-grid 21mm mode ===")
+    section("\n=== 1B.13: Half-grid 21mm mode ===")
     save(GridfinityBox(4, 2, 3, half_grid=True),              "1B13_halfgrid_4x2x3")
     save(GridfinityBox(4, 2, 3, half_grid=True, holes=True),  "1B13_halfgrid_4x2x3_mag")
     save(GridfinityBox(2, 2, 3, half_grid=True),              "1B13_halfgrid_2x2x3")
 
     # ── 1B.14: Height modes (gridz_define) ───────────────────────────────────
-    print("\n=== 1B.14: Height modes (gridz_define) ===")
+    section("\n=== 1B.14: Height modes (gridz_define) ===")
     save(GridfinityBox(2, 2, 3),                              "1B14_height_mode0_2x2x3u")
     save(GridfinityBox(2, 2, 21.0, gridz_define=1),           "1B14_height_mode1_2x2_21mm-int")
     save(GridfinityBox(2, 2, 24.8, gridz_define=2),           "1B14_height_mode2_2x2_24p8mm-ext")
     save(GridfinityBox(2, 2, 29.2, gridz_define=3),           "1B14_height_mode3_2x2_29p2mm-total")
 
     # ── 1B.15: Z-snap ────────────────────────────────────────────────────────
-    print("\n=== 1B.15: Z-snap ===")
+    section("\n=== 1B.15: Z-snap ===")
     save(GridfinityBox(2, 2, 2.5, enable_zsnap=True),         "1B15_zsnap_mode0_2p5u_snaps-to-3u")
     save(GridfinityBox(2, 2, 25.0, gridz_define=1, enable_zsnap=True),
          "1B15_zsnap_mode1_25mm-int_snaps-to-28mm")
 
     # ── 1B.16: Spiral vase shell ─────────────────────────────────────────────
-    print("\n=== 1B.16: Spiral vase shell (GridfinityVaseBox) ===")
+    section("\n=== 1B.16: Spiral vase shell (GridfinityVaseBox) ===")
     save(GridfinityVaseBox(1, 1, 3),                              "1B16_vase_1x1x3_default")
     save(GridfinityVaseBox(2, 1, 3),                              "1B16_vase_2x1x3")
     save(GridfinityVaseBox(2, 2, 3),                              "1B16_vase_2x2x3")
@@ -140,12 +169,14 @@ def main():
     save(GridfinityVaseBox(1, 1, 3, style_tab=6),                 "1B16_vase_1x1x3_tab-none")
 
     # ── 1B.17: Spiral vase base insert ───────────────────────────────────────
-    print("\n=== 1B.17: Spiral vase base insert (GridfinityVaseBase) ===")
+    section("\n=== 1B.17: Spiral vase base insert (GridfinityVaseBase) ===")
     save(GridfinityVaseBase(1, 1),                                "1B17_vasebase_1x1_mag")
     save(GridfinityVaseBase(2, 2),                                "1B17_vasebase_2x2_mag")
     save(GridfinityVaseBase(2, 2, holes=False),                   "1B17_vasebase_2x2_noholes")
     save(GridfinityVaseBase(2, 2, style_base=1),                  "1B17_vasebase_2x2_corners")
 
+    run_jobs()
+
     print("\n=== DONE ===")
     step_files = [f for f in os.listdir(OUTPUT_DIR) if f.endswith(".step")]
     print(f"Generated {len(step_files)} STEP files total in {OUTPUT_DIR}/")
@@ -1,25 +1,59 @@
+from collections import namedtuple
+from functools import lru_cache
 import os
 
+import pytest
+
 EXPORT_STEP_FILE_PATH = "./tests/testfiles"
 
 env = dict(os.environ)
+# Each pytest-xdist worker exports into its own sub-directory, so that tests
+# which save the same object on different workers never write one file
+# concurrently
+if "PYTEST_XDIST_WORKER" in env:
+    EXPORT_STEP_FILE_PATH = os.path.join(
+        EXPORT_STEP_FILE_PATH, env["PYTEST_XDIST_WORKER"]
+    )
 SKIP_TEST_BOX = "SKIP_TEST_BOX" in env
 SKIP_TEST_RBOX = "SKIP_TEST_RBOX" in env
 SKIP_TEST_SPACER = "SKIP_TEST_SPACER" in env
 SKIP_TEST_BASEPLATE = "SKIP_TEST_BASEPLATE" in env
+# Shared skip marks for individual tests in modules which mix scopes
+_SKIP_REASON = "Skipped intentionally by test scope environment variable"
+box_scope = pytest.mark.skipif(SKIP_TEST_BOX, reason=_SKIP_REASON)
+baseplate_scope = pytest.mark.skipif(SKIP_TEST_BASEPLATE, reason=_SKIP_REASON)
+# "step" (default) or "brep" for quicker exports during development
+EXPORT_FORMAT = env.get("EXPORT_FORMAT", "step").lower()
+# Coarse tessellation for STL test artifacts, which are only inspected by eye
+EXPORT_STL_TOL = 0.1
+EXPORT_STL_ANG_TOL = 0.5
+# Skips the full BRepCheck_Analyzer pass of isValid() for quick local runs
+SKIP_VALIDATION = "SKIP_VALIDATION" in env
 
 
 def INCHES(x):
     return x * 25.4
 
 
+@lru_cache(maxsize=256)
+def _selection_counts(shapes, face):
+    """Number of faces picked by a selector, and of edges on those faces.
+
+    Tests usually check the faces and then the edges of the same selection,
+    so both counts come from a single selector pass per shape."""
+    from cadquery import Workplane
+
+    faces = Workplane("XY").add(list(shapes)).faces(face)
+    return len(faces.vals()), len(faces.edges().vals())
+
+
 def _faces_match(obj, face, n):
-    nf = len(obj.faces(face).vals())
+    nf, _ = _selection_counts(tuple(obj.vals()), face)
     return nf == n
 
 
 def _edges_match(obj, face, n):
-    nf = len(obj.faces(face).edges().vals())
+    _, nf = _selection_counts(tuple(obj.vals()), face)
     return abs(nf - n) < 3
 
 
@@ -29,6 +63,76 @@ def _almost_same(x, y, tol=1e-3):
     return abs(x - y) < tol
 
 
+@lru_cache(maxsize=256)
+def _shape_valid(shape):
+    return shape.isValid()
+
+
+def _assert_valid(obj, msg=None):
+    """Asserts that a workplane's shape is valid, unless SKIP_VALIDATION is set."""
+    if not SKIP_VALIDATION:
+        assert _shape_valid(obj.val()), msg
+
+
+@lru_cache(maxsize=256)
+def _shape_bbox(shape):
+    return shape.BoundingBox()
+
+
+def bbox_cached(obj):
+    """Bounding box of a workplane's shape, computed once per shape. The
+    returned BoundBox is shared, so it must only be read."""
+    return _shape_bbox(obj.val())
+
+
+@lru_cache(maxsize=256)
+def _shape_size(shape):
+    bb = _shape_bbox(shape)
+    return bb.xlen, bb.ylen, bb.zlen
+
+
+def size_3d_cached(obj):
+    """Same as cqkit's size_3d(), but the bounding box of each shape is only
+    computed once; shapes shared between tests via cq_obj or session
+    fixtures are measured a single time."""
+    return _shape_size(obj.val())
+
+
+@lru_cache(maxsize=256)
+def _shape_volume(shape):
+    return shape.Volume()
+
+
+def volume_cached(obj):
+    """Volume of a workplane's shape, integrated once per shape."""
+    return _shape_volume(obj.val())
+
+
+ShapeInfo = namedtuple("ShapeInfo", "size flat_edges flat_faces")
+
+
+@lru_cache(maxsize=256)
+def _flat_counts(shapes, flat_at):
+    from cadquery import Workplane
+    from cqkit import FlatEdgeSelector, FlatFaceSelector
+
+    r = Workplane("XY").add(list(shapes))
+    return (
+        len(r.edges(FlatEdgeSelector(flat_at)).vals()),
+        len(r.faces(FlatFaceSelector(flat_at)).vals()),
+    )
+
+
+def inspect_shape(obj, flat_at=0):
+    """Size and flat edge and face counts of a workplane's shape.
+
+    The counts come from cqkit's FlatEdgeSelector and FlatFaceSelector at
+    flat_at, and like the size are computed once per shape. Validity is
+    left to _assert_valid(), so that SKIP_VALIDATION applies."""
+    ne, nf = _flat_counts(tuple(obj.vals()), flat_at)
+    return ShapeInfo(_shape_size(obj.val()), ne, nf)
+
+
 def _export_files(spec="all"):
     if "EXPORT_STEP_FILES" in env:
         exp_var = env["EXPORT_STEP_FILES"].lower()
@@ -38,3 +142,14 @@ def _export_files(spec="all"):
             return True
         return False
     return False
+
+
+def _save_export(obj, filename=None, path=None):
+    """Saves a test export in EXPORT_FORMAT, i.e. as a binary BRep file
+    when EXPORT_FORMAT=brep, otherwise as a STEP file."""
+    if EXPORT_FORMAT == "brep":
+        if filename is not None:
+            filename = os.path.splitext(filename)[0]
+        obj.save_brep_file(filename=filename, path=path)
+    else:
+        obj.save_step_file(filename=filename, path=path)
@@ -4,8 +4,92 @@ Policy: tests that check isValid() or topology (face/edge counts) MUST use
 default fillets. Only tests that check bounding-box dimensions or filenames
 may use fillet_interior=False. See WI-2 guardrails in the optimization plan.
 """
+from collections import namedtuple
+import os
+
 import pytest
 
+# Rewrite the asserts in the shared helpers too, e.g. _assert_valid()
+pytest.register_assert_rewrite("common_test")
+
+from common_test import (
+    EXPORT_STEP_FILE_PATH,
+    size_3d_cached,
+    volume_cached,
+)
+
+# CadQuery and cqgridfinity are imported inside the fixtures, so that test
+# modules skipped by scope never pay for loading OCCT
+
+# A rendered reference object with its volume and bounding box size, and the
+# object it was rendered from
+Rendered = namedtuple("Rendered", "r volume size obj")
+
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: full-fillet tests (run with -m slow)")
+    if "EXPORT_STEP_FILES" in os.environ:
+        os.makedirs(EXPORT_STEP_FILE_PATH, exist_ok=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _occt_warmup():
+    """Pay OCCT's first-call setup once per worker, before the first test."""
+    import cadquery as cq
+
+    cq.Workplane("XY").box(1, 1, 1).val().Volume()
+
+
+def _rendered_box(*args, **kwargs):
+    from cqgridfinity import GridfinityBox
+
+    box = GridfinityBox(*args, **kwargs)
+    r = box.cq_obj
+    return Rendered(r, volume_cached(r), size_3d_cached(r), box)
+
+
+@pytest.fixture(scope="session")
+def plain_box_223():
+    """Plain 2x2x3 bin without interior fillets, rendered once per session."""
+    return _rendered_box(2, 2, 3, fillet_interior=False)
+
+
+@pytest.fixture(scope="session")
+def plain_box_225():
+    """Plain 2x2x5 bin without interior fillets, rendered once per session."""
+    return _rendered_box(2, 2, 5, fillet_interior=False)
+
+
+@pytest.fixture(scope="session")
+def nolip_box_223():
+    """2x2x3 bin without lip or interior fillets, rendered once per session."""
+    return _rendered_box(2, 2, 3, no_lip=True, fillet_interior=False)
+
+
+@pytest.fixture(scope="session")
+def printable_hole_box_223():
+    """2x2x3 bin with printable hole tops and no interior fillets, the shared
+    reference for the enhanced hole bin tests, rendered once per session."""
+    return _rendered_box(
+        2, 2, 3, holes=True, printable_hole_top=True, fillet_interior=False
+    )
+
+
+def _rendered_baseplate(*args, **kwargs):
+    from cqgridfinity import GridfinityBaseplate
+
+    bp = GridfinityBaseplate(*args, **kwargs)
+    r = bp.cq_obj
+    return Rendered(r, volume_cached(r), size_3d_cached(r), bp)
+
+
+@pytest.fixture(scope="session")
+def magnet_baseplate_22():
+    """2x2 baseplate with magnet holes, rendered once per session."""
+    return _rendered_baseplate(2, 2, magnet_holes=True)
+
+
+@pytest.fixture(scope="session")
+def skel_magnet_baseplate_22():
+    """2x2 skeleton baseplate with magnet holes, rendered once per session."""
+    return _rendered_baseplate(2, 2, skeleton=True, magnet_holes=True)
@@ -1,233 +1,217 @@
 # Gridfinity tests
 import pytest
 
+from common_test import SKIP_TEST_BASEPLATE
+
+# Skip the whole module, before importing cqgridfinity, when out of scope
+if SKIP_TEST_BASEPLATE:
+    pytest.skip(
+        "Skipped intentionally by test scope environment variable",
+        allow_module_level=True,
+    )
+
 # my modules
 from cqgridfinity import *
+from cqgridfinity import gf_baseplate, gf_obj
 from cqgridfinity.constants import (
     GR_BASE_HEIGHT,
     GR_HOLE_H,
     GR_ST_ADDITIONAL_H,
     GRU,
 )
-from cqkit import FlatEdgeSelector
-from cqkit.cq_helpers import size_3d
+from cqgridfinity.gf_helpers import NO_RENDER_CACHE
 from common_test import (
+    _assert_valid,
+    size_3d_cached,
+    volume_cached,
     EXPORT_STEP_FILE_PATH,
     _almost_same,
     _faces_match,
     _export_files,
-    SKIP_TEST_BASEPLATE,
+    _save_export,
+    inspect_shape,
 )
 
+# Baseplates are rendered through cq_obj rather than render(), so configurations
+# repeated across tests (e.g. 4x3 plain, 2x2 screw-together) share one render
+# from the module-level render cache instead of rebuilding it each time.
+
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_make_baseplate():
     bp = GridfinityBaseplate(4, 3)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
+    info = inspect_shape(r)
     if _export_files("baseplate"):
-        bp.save_step_file(path=EXPORT_STEP_FILE_PATH)
+        _save_export(bp, path=EXPORT_STEP_FILE_PATH)
     assert bp.filename() == "gf_baseplate_4x3"
-    assert _almost_same(size_3d(r), (168, 126, 4.75))
+    assert _almost_same(info.size, (168, 126, 4.75))
     assert _faces_match(r, ">Z", 16)
     assert _faces_match(r, "<Z", 1)
-    edge_diff = abs(len(r.edges(FlatEdgeSelector(0)).vals()) - 104)
-    assert edge_diff < 3
+    assert abs(info.flat_edges - 104) < 3
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_make_ext_baseplate():
     bp = GridfinityBaseplate(5, 4, ext_depth=5, corner_screws=True)
-    r = bp.render()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (210, 168, 9.75))
-    edge_diff = abs(len(r.edges(FlatEdgeSelector(0)).vals()) - 188)
-    assert edge_diff < 3
+    r = bp.cq_obj
+    _assert_valid(r)
+    info = inspect_shape(r)
+    assert _almost_same(info.size, (210, 168, 9.75))
+    assert abs(info.flat_edges - 188) < 3
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
-def test_magnet_baseplate():
+def test_magnet_baseplate(magnet_baseplate_22):
     """Baseplate with magnet holes only."""
-    bp = GridfinityBaseplate(2, 2, magnet_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    bp = magnet_baseplate_22.obj
+    _assert_valid(magnet_baseplate_22.r)
     # ext_depth should auto-adjust to GR_HOLE_H (2.4mm)
     assert bp.ext_depth == GR_HOLE_H
     expected_h = GR_BASE_HEIGHT + GR_HOLE_H  # 4.75 + 2.4 = 7.15
-    assert _almost_same(size_3d(r), (84, 84, expected_h), tol=0.1)
+    assert _almost_same(magnet_baseplate_22.size, (84, 84, expected_h), tol=0.1)
     # Should have 4 holes per cell × 4 cells = 16 magnet holes
     if _export_files("baseplate"):
-        bp.save_step_file(filename="./tests/testfiles/gf_baseplate_2x2_magnets.step")
+        _save_export(bp, filename="./tests/testfiles/gf_baseplate_2x2_magnets.step")
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_baseplate():
     """Baseplate with screw through-holes only."""
     bp = GridfinityBaseplate(2, 2, screw_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     # ext_depth should auto-adjust to 4.0mm
     assert bp.ext_depth == 4.0
     expected_h = GR_BASE_HEIGHT + 4.0  # 4.75 + 4.0 = 8.75
-    assert _almost_same(size_3d(r), (84, 84, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (84, 84, expected_h), tol=0.1)
     if _export_files("baseplate"):
-        bp.save_step_file(filename="./tests/testfiles/gf_baseplate_2x2_screws.step")
+        _save_export(bp, filename="./tests/testfiles/gf_baseplate_2x2_screws.step")
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_magnet_screw_baseplate():
     """Baseplate with combined magnet recesses and screw through-holes."""
     bp = GridfinityBaseplate(2, 2, magnet_holes=True, screw_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     # ext_depth should auto-adjust to GR_HOLE_H + 4.0 = 6.4mm
     assert bp.ext_depth == GR_HOLE_H + 4.0
     expected_h = GR_BASE_HEIGHT + GR_HOLE_H + 4.0  # 4.75 + 6.4 = 11.15
-    assert _almost_same(size_3d(r), (84, 84, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (84, 84, expected_h), tol=0.1)
     if _export_files("baseplate"):
-        bp.save_step_file(
-            filename="./tests/testfiles/gf_baseplate_2x2_magnet_screw.step"
+        _save_export(
+            bp, filename="./tests/testfiles/gf_baseplate_2x2_magnet_screw.step"
         )
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_weighted_baseplate():
     """Weighted baseplate with weight pockets in bottom."""
     bp = GridfinityBaseplate(2, 2, weighted=True, magnet_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     # ext_depth should auto-adjust to GR_BP_BOT_H (6.4mm)
     assert bp.ext_depth == GR_BP_BOT_H
     expected_h = GR_BASE_HEIGHT + GR_BP_BOT_H  # 4.75 + 6.4 = 11.15
-    assert _almost_same(size_3d(r), (84, 84, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (84, 84, expected_h), tol=0.1)
     if _export_files("baseplate"):
-        bp.save_step_file(filename="./tests/testfiles/gf_baseplate_2x2_weighted.step")
+        _save_export(bp, filename="./tests/testfiles/gf_baseplate_2x2_weighted.step")
+
+
+@pytest.mark.skipif(
+    NO_RENDER_CACHE, reason="Render caches disabled by CQGF_NO_RENDER_CACHE"
+)
+def test_receptacle_plate_shared():
+    """Baseplates differing only in hole style share one receptacle plate."""
+    bp1 = GridfinityBaseplate(2, 2, magnet_holes=True)
+    bp2 = GridfinityBaseplate(2, 2, magnet_holes=True, chamfer_holes=True)
+    r1 = bp1._receptacle_plate()
+    r2 = bp2._receptacle_plate()
+    assert r1 is not r2
+    assert r1.val().isSame(r2.val())
+    bp3 = GridfinityBaseplate(2, 2, magnet_holes=True, screw_holes=True)
+    assert not bp3._receptacle_plate().val().isSame(r1.val())
+
+
+def test_baseplate_render_uncached(monkeypatch):
+    """Baseplates render with the receptacle plate and render caches off."""
+    monkeypatch.setattr(gf_baseplate, "_PLATE_CACHE_SIZE", 0)
+    monkeypatch.setattr(gf_obj, "_RENDER_CACHE_SIZE", 0)
+    clear_render_cache()
+    bp = GridfinityBaseplate(2, 2, magnet_holes=True)
+    r = bp.cq_obj
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (84, 84, GR_BASE_HEIGHT + bp.ext_depth))
+    assert not gf_baseplate._PLATE_CACHE
+    assert not gf_obj._RENDER_CACHE
 
 
 # --- Screw-together baseplate tests (1B.10) ---
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_basic():
     """2x2 screw-together baseplate: valid, correct height and filename."""
     bp = GridfinityBaseplate(2, 2, screw_together=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     assert bp.ext_depth == GR_ST_ADDITIONAL_H  # 6.75mm
     expected_h = GR_BASE_HEIGHT + GR_ST_ADDITIONAL_H  # 4.75 + 6.75 = 11.5
-    assert _almost_same(size_3d(r), (84, 84, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (84, 84, expected_h), tol=0.1)
+    # Screw-together without skeleton (kennetek style_plate=4)
     assert "_screwtog" in bp.filename()
+    assert "_skel" not in bp.filename()
     if _export_files("baseplate"):
-        bp.save_step_file(filename="./tests/testfiles/gf_baseplate_2x2_screwtog.step")
+        _save_export(bp, filename="./tests/testfiles/gf_baseplate_2x2_screwtog.step")
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_with_skeleton():
     """Skeleton + screw-together (kennetek style_plate=3): both coexist."""
     bp = GridfinityBaseplate(2, 2, skeleton=True, screw_together=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     # ext_depth should be max of skeleton needs and screw-together needs
     assert bp.ext_depth >= GR_ST_ADDITIONAL_H
     assert "_skel" in bp.filename()
     assert "_screwtog" in bp.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
-def test_screw_together_minimal():
-    """Screw-together without skeleton (kennetek style_plate=4): valid."""
-    bp = GridfinityBaseplate(2, 2, screw_together=True)
-    r = bp.render()
-    assert r.val().isValid()
-    # No skeleton tag, just screwtog
-    assert "_skel" not in bp.filename()
-    assert "_screwtog" in bp.filename()
-
-
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_with_magnets():
     """Screw-together + magnet holes: ext_depth = max(6.75, 2.4) = 6.75."""
     bp = GridfinityBaseplate(2, 2, screw_together=True, magnet_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     assert bp.ext_depth == GR_ST_ADDITIONAL_H  # 6.75 > 2.4
     assert "_screwtog" in bp.filename()
     assert "_mag" in bp.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_multi_screw():
     """Multi-screw (n_screws=2 and 3): valid, more holes = less volume."""
     bp1 = GridfinityBaseplate(2, 2, screw_together=True, n_screws=1)
-    r1 = bp1.render()
+    r1 = bp1.cq_obj
     bp2 = GridfinityBaseplate(2, 2, screw_together=True, n_screws=2)
-    r2 = bp2.render()
+    r2 = bp2.cq_obj
     bp3 = GridfinityBaseplate(2, 2, screw_together=True, n_screws=3)
-    r3 = bp3.render()
-    assert r1.val().isValid()
-    assert r2.val().isValid()
-    assert r3.val().isValid()
+    r3 = bp3.cq_obj
+    _assert_valid(r1)
+    _assert_valid(r2)
+    _assert_valid(r3)
     # More screws = more material removed
-    v1 = r1.val().Volume()
-    v2 = r2.val().Volume()
-    v3 = r3.val().Volume()
+    v1 = volume_cached(r1)
+    v2 = volume_cached(r2)
+    v3 = volume_cached(r3)
     assert v2 < v1
     assert v3 < v2
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_volume():
     """Screw-together has less volume than equivalent non-screw baseplate."""
     # Both use solid-slab render path (magnet_holes triggers _has_bottom_features)
     bp_plain = GridfinityBaseplate(2, 2, magnet_holes=True, ext_depth=GR_ST_ADDITIONAL_H)
     bp_screw = GridfinityBaseplate(2, 2, magnet_holes=True, screw_together=True)
-    r_plain = bp_plain.render()
-    r_screw = bp_screw.render()
+    r_plain = bp_plain.cq_obj
+    r_screw = bp_screw.cq_obj
     # Same ext_depth, same magnet holes; screw-together removes additional material
     assert bp_plain.ext_depth == bp_screw.ext_depth
-    assert r_screw.val().Volume() < r_plain.val().Volume()
+    assert volume_cached(r_screw) < volume_cached(r_plain)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_filename():
     """Filename variations for screw-together configs."""
     bp1 = GridfinityBaseplate(2, 2, screw_together=True)
@@ -246,42 +230,30 @@ def test_screw_together_filename():
     assert "_mag" in fn
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_screw_together_large_grid():
     """4x3 screw-together for tiling correctness on larger grids."""
     bp = GridfinityBaseplate(4, 3, screw_together=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     expected_h = GR_BASE_HEIGHT + GR_ST_ADDITIONAL_H
-    assert _almost_same(size_3d(r), (168, 126, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (168, 126, expected_h), tol=0.1)
     if _export_files("baseplate"):
-        bp.save_step_file(filename="./tests/testfiles/gf_baseplate_4x3_screwtog.step")
+        _save_export(bp, filename="./tests/testfiles/gf_baseplate_4x3_screwtog.step")
 
 
 # --- Fit-to-drawer baseplate tests (1B.11) ---
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_basic():
     """200x150mm drawer → 4x3 grid, outer dims = 200x150, valid solid."""
     bp = GridfinityBaseplate(0, 0, distancex=200, distancey=150)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     assert bp.length_u == 4  # floor(200/42) = 4
     assert bp.width_u == 3   # floor(150/42) = 3
-    assert _almost_same(size_3d(r), (200, 150, GR_BASE_HEIGHT), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (200, 150, GR_BASE_HEIGHT), tol=0.1)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_auto_grid():
     """Floor division auto-calc: 200/42=4, 100/42=2, 30/42→clamped to 1."""
     bp1 = GridfinityBaseplate(0, 0, distancex=200, distancey=100)
@@ -293,10 +265,6 @@ def test_fit_to_drawer_auto_grid():
     assert bp2.width_u == 1
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_alignment():
     """fitx=-1/0/+1: same outer bounding box dims, all valid."""
     dims = (200, 150)
@@ -304,45 +272,33 @@ def test_fit_to_drawer_alignment():
         bp = GridfinityBaseplate(
             0, 0, distancex=dims[0], distancey=dims[1], fitx=fitx_val
         )
-        r = bp.render()
-        assert r.val().isValid(), f"Invalid solid for fitx={fitx_val}"
+        r = bp.cq_obj
+        _assert_valid(r, f"Invalid solid for fitx={fitx_val}")
         assert _almost_same(
-            size_3d(r), (dims[0], dims[1], GR_BASE_HEIGHT), tol=0.1
+            size_3d_cached(r), (dims[0], dims[1], GR_BASE_HEIGHT), tol=0.1
         ), f"Wrong dims for fitx={fitx_val}"
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_explicit_grid():
     """Explicit 3x2 + distancex=200: grid preserved, outer padded."""
     bp = GridfinityBaseplate(3, 2, distancex=200)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     assert bp.length_u == 3  # explicit, not overridden
     assert bp.width_u == 2
     # Outer X = max(3*42=126, 200) = 200; Y = max(2*42=84, 0) = 84
-    assert _almost_same(size_3d(r), (200, 84, GR_BASE_HEIGHT), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (200, 84, GR_BASE_HEIGHT), tol=0.1)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_with_magnets():
     """Fit-to-drawer + magnet_holes: valid, correct height."""
     bp = GridfinityBaseplate(0, 0, distancex=200, distancey=150, magnet_holes=True)
-    r = bp.render()
-    assert r.val().isValid()
+    r = bp.cq_obj
+    _assert_valid(r)
     expected_h = GR_BASE_HEIGHT + GR_HOLE_H
-    assert _almost_same(size_3d(r), (200, 150, expected_h), tol=0.1)
+    assert _almost_same(size_3d_cached(r), (200, 150, expected_h), tol=0.1)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_filename():
     """Filename includes _fit200x150 suffix."""
     bp = GridfinityBaseplate(0, 0, distancex=200, distancey=150)
@@ -351,18 +307,14 @@ def test_fit_to_drawer_filename():
     assert fn == "gf_baseplate_4x3_fit200x150"
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BASEPLATE,
-    reason="Skipped intentionally by test scope environment variable",
-)
 def test_fit_to_drawer_no_padding():
     """distancex=168 (4*42): zero padding, same as standard 4x3."""
     bp_fit = GridfinityBaseplate(0, 0, distancex=168, distancey=126)
     bp_std = GridfinityBaseplate(4, 3)
-    r_fit = bp_fit.render()
-    r_std = bp_std.render()
-    assert r_fit.val().isValid()
+    r_fit = bp_fit.cq_obj
+    r_std = bp_std.cq_obj
+    _assert_valid(r_fit)
     # Same grid, same outer dims
     assert bp_fit.length_u == 4
     assert bp_fit.width_u == 3
-    assert _almost_same(size_3d(r_fit), size_3d(r_std), tol=0.1)
+    assert _almost_same(size_3d_cached(r_fit), size_3d_cached(r_std), tol=0.1)
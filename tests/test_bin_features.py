@@ -2,12 +2,15 @@
 import pytest
 
 from cqgridfinity import *
-from cqkit.cq_helpers import size_3d
+from cqgridfinity.constants import GR_FLOOR
 from common_test import (
+    _assert_valid,
+    size_3d_cached,
+    volume_cached,
     _almost_same,
     _export_files,
     EXPORT_STEP_FILE_PATH,
-    SKIP_TEST_BOX,
+    box_scope,
 )
 
 
@@ -16,9 +19,7 @@ from common_test import (
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_scoop_scaling_full():
     """scoops=1.0 should produce same result as scoops=True (backward compat)."""
     # Fillet tested in test_basic_box, test_all_features_box
@@ -28,14 +29,12 @@ def test_scoop_scaling_full():
     assert b_float.scoops == 1.0
     r_bool = b_bool.render()
     r_float = b_float.render()
-    assert r_bool.val().isValid()
-    assert r_float.val().isValid()
-    assert _almost_same(size_3d(r_bool), size_3d(r_float))
+    _assert_valid(r_bool)
+    _assert_valid(r_float)
+    assert _almost_same(size_3d_cached(r_bool), size_3d_cached(r_float))
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_scoop_scaling_zero():
     """scoops=0.0 should produce same result as scoops=False."""
     # Fillet tested in test_basic_box
@@ -45,41 +44,36 @@ def test_scoop_scaling_zero():
     assert b_zero.scoops == 0.0
     r_false = b_false.render()
     r_zero = b_zero.render()
-    assert r_false.val().isValid()
-    assert r_zero.val().isValid()
-    assert _almost_same(size_3d(r_false), size_3d(r_zero))
+    _assert_valid(r_false)
+    _assert_valid(r_zero)
+    assert _almost_same(size_3d_cached(r_false), size_3d_cached(r_zero))
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_scoop_scaling_half():
+@box_scope
+def test_scoop_scaling_half(plain_box_225):
     """scoops=0.5 should produce valid geometry with smaller scoop."""
     # Fillet tested in test_all_features_box
     b = GridfinityBox(2, 2, 5, scoops=0.5, fillet_interior=False)
     assert b.scoops == 0.5
     r = b.render()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (83.5, 83.5, 38.8))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (83.5, 83.5, 38.8))
     # Half scoop should be between no-scoop and full-scoop volumes
-    b_none = GridfinityBox(2, 2, 5, scoops=False, fillet_interior=False)
+    # scoops=False is the plain bin
     b_full = GridfinityBox(2, 2, 5, scoops=True, fillet_interior=False)
-    r_none = b_none.render()
     r_full = b_full.render()
-    assert r_none.val().isValid()
-    assert r_full.val().isValid()
-    vol_none = r_none.val().Volume()
-    vol_half = r.val().Volume()
-    vol_full = r_full.val().Volume()
+    _assert_valid(plain_box_225.r)
+    _assert_valid(r_full)
+    vol_none = plain_box_225.volume
+    vol_half = volume_cached(r)
+    vol_full = volume_cached(r_full)
     # Scoop removes material from interior corners, so full scoop = less volume
     # Actually scoops are ADDED to the shell (fill corners), so more scoop = more volume
     # Half scoop should be between no-scoop and full-scoop
     assert vol_none <= vol_half <= vol_full or vol_none >= vol_half >= vol_full
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_scoop_scaling_filename():
     """Partial scoop should show scale in filename."""
     b_full = GridfinityBox(2, 2, 3, scoops=True)
@@ -90,9 +84,7 @@ def test_scoop_scaling_filename():
     assert "_scoop0.3" in b_quarter.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_scoop_scaling_clamped():
     """Scoop values outside 0-1 should be clamped."""
     b_over = GridfinityBox(2, 2, 3, scoops=1.5)
@@ -106,10 +98,8 @@ def test_scoop_scaling_clamped():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_label_style_full_backward_compat():
+@box_scope
+def test_label_style_full_backward_compat(plain_box_223):
     """labels=True with default style should match original behavior."""
     # Fillet tested in test_all_features_box
     b_old = GridfinityBox(2, 2, 3, labels=True, fillet_interior=False)
@@ -117,34 +107,34 @@ def test_label_style_full_backward_compat():
     assert b_old.labels is True
     assert "_labels" in b_old.filename()
     r = b_old.render()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (83.5, 83.5, 24.8))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (83.5, 83.5, 24.8))
     # Label adds material (overhang shelf) — labeled bin should have more volume
-    b_plain = GridfinityBox(2, 2, 3, fillet_interior=False)
-    r_plain = b_plain.render()
-    assert r.val().Volume() > r_plain.val().Volume()
+    assert volume_cached(r) > plain_box_223.volume
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_label_style_none():
+def test_safe_label_height_zero_size():
+    """A label with no width or height has no overhang to clear."""
+    b = GridfinityBox(2, 2, 3, labels=True, label_width=0, label_height=0)
+    for backwall in (False, True):
+        lh = b.safe_label_height(backwall=backwall, from_bottom=True)
+        assert _almost_same(lh, b.max_height + GR_FLOOR)
+
+
+@box_scope
+def test_label_style_none(plain_box_223):
     """label_style='none' should produce no labels."""
     # Fillet tested in test_basic_box
     b = GridfinityBox(2, 2, 3, label_style="none", fillet_interior=False)
     assert b.labels is False
     assert b.label_style == "none"
     r = b.render()
-    assert r.val().isValid()
-    b_plain = GridfinityBox(2, 2, 3, fillet_interior=False)
-    r_plain = b_plain.render()
-    assert r_plain.val().isValid()
-    assert _almost_same(size_3d(r), size_3d(r_plain))
+    _assert_valid(r)
+    _assert_valid(plain_box_223.r)
+    assert _almost_same(size_3d_cached(r), plain_box_223.size)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_auto():
     """label_style='auto' should produce valid geometry."""
     # Fillet tested in test_all_features_box
@@ -154,14 +144,12 @@ def test_label_style_auto():
     assert "_label-auto" in b.filename()
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
-    bb = r.val().BoundingBox()
-    assert bb.xlen > 0
+    _assert_valid(r)
+    sx, _, _ = size_3d_cached(r)
+    assert sx > 0
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_left():
     """label_style='left' should produce valid geometry."""
     # Fillet tested in test_all_features_box
@@ -170,12 +158,10 @@ def test_label_style_left():
     assert "_label-left" in b.filename()
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_center():
     """label_style='center' should produce valid geometry."""
     # Fillet tested in test_all_features_box
@@ -183,12 +169,10 @@ def test_label_style_center():
     assert b.label_style == "center"
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_right():
     """label_style='right' should produce valid geometry."""
     # Fillet tested in test_all_features_box
@@ -196,12 +180,10 @@ def test_label_style_right():
     assert b.label_style == "right"
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_with_dividers():
     """Positioned labels should work with width dividers."""
     # Fillet tested in test_all_features_box
@@ -209,23 +191,19 @@ def test_label_style_with_dividers():
                       fillet_interior=False)
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
-    bb = r.val().BoundingBox()
-    assert bb.xlen > 0
+    _assert_valid(r)
+    sx, _, _ = size_3d_cached(r)
+    assert sx > 0
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_invalid_label_style():
     """Invalid label_style should raise ValueError."""
     with pytest.raises(ValueError):
         GridfinityBox(2, 2, 3, label_style="invalid")
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_label_style_sets_labels():
     """Setting label_style (non-none) should automatically set labels=True."""
     b = GridfinityBox(2, 2, 3, label_style="left")
@@ -237,54 +215,42 @@ def test_label_style_sets_labels():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_compartment_depth_zero():
+@box_scope
+def test_compartment_depth_zero(plain_box_225):
     """compartment_depth=0 should be same as default."""
     # Fillet tested in test_basic_box
-    b_default = GridfinityBox(2, 2, 5, fillet_interior=False)
     b_zero = GridfinityBox(2, 2, 5, compartment_depth=0, fillet_interior=False)
-    r_default = b_default.render()
     r_zero = b_zero.render()
-    assert r_default.val().isValid()
-    assert r_zero.val().isValid()
-    assert _almost_same(size_3d(r_default), size_3d(r_zero))
+    _assert_valid(plain_box_225.r)
+    _assert_valid(r_zero)
+    assert _almost_same(plain_box_225.size, size_3d_cached(r_zero))
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_compartment_depth_raises_floor():
+@box_scope
+def test_compartment_depth_raises_floor(plain_box_225):
     """compartment_depth > 0 should raise the floor, reducing interior volume."""
     # Fillet tested in test_basic_box
-    b_full = GridfinityBox(2, 2, 5, fillet_interior=False)
     b_shallow = GridfinityBox(2, 2, 5, compartment_depth=5, fillet_interior=False)
-    r_full = b_full.render()
     r_shallow = b_shallow.render()
-    assert r_full.val().isValid()
-    assert r_shallow.val().isValid()
+    _assert_valid(plain_box_225.r)
+    _assert_valid(r_shallow)
     # Same exterior dimensions
-    assert _almost_same(size_3d(r_full), size_3d(r_shallow))
+    assert _almost_same(plain_box_225.size, size_3d_cached(r_shallow))
     # Shallow bin has more material (raised floor fills interior)
-    vol_full = r_full.val().Volume()
-    vol_shallow = r_shallow.val().Volume()
+    vol_full = plain_box_225.volume
+    vol_shallow = volume_cached(r_shallow)
     assert vol_shallow > vol_full
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_compartment_depth_filename():
     """compartment_depth should appear in filename."""
     b = GridfinityBox(2, 2, 3, compartment_depth=3)
     assert "_d3.0" in b.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_height_internal_override():
+@box_scope
+def test_height_internal_override(plain_box_225):
     """height_internal sets a fixed internal height."""
     # Fillet tested in test_basic_box
     b = GridfinityBox(2, 2, 5, height_internal=10, fillet_interior=False)
@@ -292,24 +258,20 @@ def test_height_internal_override():
     assert "_hi10.0" in b.filename()
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
     # height_internal bin should have more material (raised floor) than default
-    b_default = GridfinityBox(2, 2, 5, fillet_interior=False)
-    r_default = b_default.render()
-    assert r.val().Volume() > r_default.val().Volume()
+    assert volume_cached(r) > plain_box_225.volume
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_compartment_depth_with_scoops():
     """Scoops should adjust to raised floor."""
     # Fillet tested in test_all_features_box
     b = GridfinityBox(2, 2, 5, scoops=True, compartment_depth=5, fillet_interior=False)
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (83.5, 83.5, 38.8))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (83.5, 83.5, 38.8))
 
 
 # ---------------------------------------------------------------------------
@@ -317,22 +279,18 @@ def test_compartment_depth_with_scoops():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_basic():
     """Basic cylindrical bin should render valid geometry."""
     b = GridfinityBox(2, 2, 5, cylindrical=True, cylinder_diam=20)
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (83.5, 83.5, 38.8))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (83.5, 83.5, 38.8))
     assert "_cyl20" in b.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_compartments_are_open():
     """Cylindrical holes must be open at the top — no sealed interior cavity.
 
@@ -349,9 +307,7 @@ def test_cylindrical_compartments_are_open():
     )
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_with_dividers():
     """Cylindrical with dividers should create multiple cylinders."""
     b1 = GridfinityBox(2, 2, 5, cylindrical=True, cylinder_diam=20)
@@ -359,31 +315,27 @@ def test_cylindrical_with_dividers():
                        length_div=1, width_div=1)
     r1 = b1.render()
     r4 = b4.render()
-    assert r1.val().isValid()
-    assert r4.val().isValid()
+    _assert_valid(r1)
+    _assert_valid(r4)
     # 4 cylinders should remove more material than 1 cylinder
-    vol1 = r1.val().Volume()
-    vol4 = r4.val().Volume()
+    vol1 = volume_cached(r1)
+    vol4 = volume_cached(r4)
     assert vol4 < vol1
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_auto_clamps_diameter():
     """Cylinder diameter should be clamped to fit in compartment."""
     # 1x1 bin with huge cylinder request — should clamp to fit
     b = GridfinityBox(1, 1, 3, cylindrical=True, cylinder_diam=100)
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
-    bb = r.val().BoundingBox()
-    assert bb.xlen > 0
+    _assert_valid(r)
+    sx, _, _ = size_3d_cached(r)
+    assert sx > 0
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_default_diameter():
     """Default cylinder diameter is GR_CYL_DIAM (10mm)."""
     b = GridfinityBox(2, 2, 3, cylindrical=True)
@@ -391,23 +343,19 @@ def test_cylindrical_default_diameter():
     assert b.cylinder_chamfer == GR_CYL_CHAMFER
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_with_holes():
     """Cylindrical bins should support bottom holes."""
     b = GridfinityBox(2, 2, 3, cylindrical=True, cylinder_diam=20, holes=True)
     r = b.render()
     assert r is not None
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_cylindrical_with_depth():
     """Cylindrical bins should respect compartment_depth."""
     b_full = GridfinityBox(2, 2, 5, cylindrical=True, cylinder_diam=20)
@@ -415,11 +363,11 @@ def test_cylindrical_with_depth():
                               compartment_depth=5)
     r_full = b_full.render()
     r_shallow = b_shallow.render()
-    assert r_full.val().isValid()
-    assert r_shallow.val().isValid()
+    _assert_valid(r_full)
+    _assert_valid(r_shallow)
     # Shallower cylinders = more material remaining
-    vol_full = r_full.val().Volume()
-    vol_shallow = r_shallow.val().Volume()
+    vol_full = volume_cached(r_full)
+    vol_shallow = volume_cached(r_shallow)
     assert vol_shallow > vol_full
 
 
@@ -428,35 +376,38 @@ def test_cylindrical_with_depth():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
-def test_step_export_bin_features():
-    """Generate reference STEP files for 1B.5-1B.8 visual inspection."""
-    if not _export_files("bin_features"):
-        pytest.skip("Set EXPORT_STEP_FILES=bin_features to generate")
-
-    bins = [
+@box_scope
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
         # 1B.5: Scoop scaling
-        GridfinityBox(2, 2, 5, scoops=0.3),
-        GridfinityBox(2, 2, 5, scoops=0.5),
-        GridfinityBox(2, 2, 5, scoops=1.0),
+        ((2, 2, 5), dict(scoops=0.3)),
+        ((2, 2, 5), dict(scoops=0.5)),
+        ((2, 2, 5), dict(scoops=1.0)),
         # 1B.6: Tab positioning
-        GridfinityBox(3, 2, 5, label_style="auto", length_div=1),
-        GridfinityBox(3, 2, 5, label_style="left", length_div=1),
-        GridfinityBox(3, 2, 5, label_style="center", length_div=1),
-        GridfinityBox(3, 2, 5, label_style="right", length_div=1),
+        ((3, 2, 5), dict(label_style="auto", length_div=1)),
+        ((3, 2, 5), dict(label_style="left", length_div=1)),
+        ((3, 2, 5), dict(label_style="center", length_div=1)),
+        ((3, 2, 5), dict(label_style="right", length_div=1)),
         # 1B.7: Custom compartment depth
-        GridfinityBox(2, 2, 5, compartment_depth=5),
-        GridfinityBox(2, 2, 5, height_internal=10),
+        ((2, 2, 5), dict(compartment_depth=5)),
+        ((2, 2, 5), dict(height_internal=10)),
         # 1B.8: Cylindrical compartments
-        GridfinityBox(2, 2, 5, cylindrical=True, cylinder_diam=20),
-        GridfinityBox(3, 3, 5, cylindrical=True, cylinder_diam=15,
-                      length_div=1, width_div=1),
-    ]
-    for b in bins:
-        b.render()
-        b.save_step_file(path=EXPORT_STEP_FILE_PATH)
+        ((2, 2, 5), dict(cylindrical=True, cylinder_diam=20)),
+        (
+            (3, 3, 5),
+            dict(cylindrical=True, cylinder_diam=15, length_div=1, width_div=1),
+        ),
+    ],
+)
+def test_step_export_bin_features(args, kwargs):
+    """Generate reference STEP files for 1B.5-1B.8 visual inspection.
+
+    One test per bin, so that pytest-xdist spreads the renders over workers."""
+    if not _export_files("bin_features"):
+        pytest.skip("Set EXPORT_STEP_FILES=bin_features to generate")
+    b = GridfinityBox(*args, **kwargs)
+    b.save_step_file(path=EXPORT_STEP_FILE_PATH)
 
 
 # ---------------------------------------------------------------------------
@@ -464,9 +415,7 @@ def test_step_export_bin_features():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 @pytest.mark.parametrize("kwargs,desc", [
     (dict(scoops=True, labels=True), "scoop+label"),
     (dict(scoops=True, labels=True, length_div=2), "scoop+label+div"),
@@ -488,21 +437,17 @@ def test_feature_combination(kwargs, desc):
     """Feature combinations produce valid, watertight solids."""
     box = GridfinityBox(2, 2, 5, fillet_interior=False, **kwargs)
     r = box.render()
-    assert r.val().isValid(), f"Invalid solid for {desc}"
+    _assert_valid(r, f"Invalid solid for {desc}")
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_unknown_kwarg_warns():
     """Unknown kwargs emit a warning."""
     with pytest.warns(UserWarning, match="unknown keyword argument"):
         GridfinityBox(2, 2, 3, hole=True)  # typo: 'hole' not 'holes'
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_render_exception_safety():
     """Divider counts restored even if render raises."""
     box = GridfinityBox(2, 2, 3, lite_style=True, solid=True, length_div=2)
@@ -577,26 +522,22 @@ def test_height_mode_filename():
     assert "_m3" in b3.filename()
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_height_mode1_renders():
     """Mode 1 bin (internal mm) renders a valid solid with correct dimensions."""
     # 25mm internal height → same as a ~5-unit bin
     b = GridfinityBox(2, 2, 25, gridz_define=1, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    bb = r.val().BoundingBox()
-    assert abs(bb.zlen - b.height) < 0.2
+    _assert_valid(r)
+    _, _, sz = size_3d_cached(r)
+    assert abs(sz - b.height) < 0.2
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_BOX, reason="Skipped intentionally by test scope environment variable"
-)
+@box_scope
 def test_height_mode2_renders():
     """Mode 2 bin (external mm) renders a valid solid with correct dimensions."""
     b = GridfinityBox(2, 2, 35.0, gridz_define=2, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    bb = r.val().BoundingBox()
-    assert abs(bb.zlen - 35.0) < 0.2
+    _assert_valid(r)
+    _, _, sz = size_3d_cached(r)
+    assert abs(sz - 35.0) < 0.2
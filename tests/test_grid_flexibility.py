@@ -8,8 +8,7 @@ import math
 import pytest
 
 from cqgridfinity import GridfinityBox
-from cqkit.cq_helpers import size_3d
-from common_test import _almost_same, SKIP_TEST_BOX
+from common_test import _almost_same, box_scope, size_3d_cached, _assert_valid
 from cqgridfinity.constants import GRU, GR_TOL, GR_BASE_HEIGHT, GRHU
 
 
@@ -35,36 +34,36 @@ def _expected_height(height_u):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_noninteger_bbox_25x3():
     """2.5 x 3 bin should have outer dims 2.5*42-0.5 x 3*42-0.5."""
     b = GridfinityBox(2.5, 3, 3, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, _expected_outer_l(2.5), tol=0.05)
     assert _almost_same(sy, _expected_outer_w(3), tol=0.05)
     assert _almost_same(sz, _expected_height(3), tol=0.05)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_noninteger_bbox_15x2():
     """1.5 x 2 bin should produce correct outer dimensions."""
     b = GridfinityBox(1.5, 2, 2, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, _expected_outer_l(1.5), tol=0.05)
     assert _almost_same(sy, _expected_outer_w(2), tol=0.05)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_noninteger_point1_step():
     """3.1 x 2.7 bin (.1 step) should render as a valid solid."""
     b = GridfinityBox(3.1, 2.7, 4, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, _expected_outer_l(3.1), tol=0.05)
     assert _almost_same(sy, _expected_outer_w(2.7), tol=0.05)
 
@@ -151,31 +150,31 @@ def test_filename_fmt_unit_floats():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_integer_backward_compat_bbox():
     """Integer grid sizes should produce the same outer dims as before."""
     b = GridfinityBox(2, 3, 4, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, _expected_outer_l(2), tol=0.05)
     assert _almost_same(sy, _expected_outer_w(3), tol=0.05)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_noninteger_with_holes():
     """Non-integer grid with holes should render without error."""
     b = GridfinityBox(2.5, 2, 3, holes=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_noninteger_with_features():
     """Non-integer grid with scoops + labels should render as valid solid."""
     b = GridfinityBox(2.5, 2, 4, scoops=True, labels=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
 # ---------------------------------------------------------------------------
@@ -219,29 +218,29 @@ def test_halfgrid_bbox_4x2():
     b = GridfinityBox(4, 2, 3, half_grid=True, fillet_interior=False)
     assert b.half_grid is True
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, 4 * 21 - 0.5, tol=0.05)  # 83.5 mm
     assert _almost_same(sy, 2 * 21 - 0.5, tol=0.05)  # 41.5 mm
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_bbox_2x2():
     """2×2 half-grid bin is 42×42mm outer — equivalent to a 1×1 full-grid bin."""
     b = GridfinityBox(2, 2, 3, half_grid=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     assert _almost_same(sx, 2 * 21 - 0.5, tol=0.05)  # 41.5 mm
     assert _almost_same(sy, 2 * 21 - 0.5, tol=0.05)  # 41.5 mm
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_isvalid():
     """Half-grid bins should render as valid closed solids."""
     b = GridfinityBox(4, 2, 4, half_grid=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
 def test_halfgrid_grid_unit():
@@ -354,36 +353,36 @@ def test_halfgrid_standard_unchanged():
     assert _almost_same(b.outer_w, 3 * GRU - 0.5)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_with_holes():
     """Half-grid bin with holes should render without error."""
     b = GridfinityBox(4, 2, 3, half_grid=True, holes=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_2x1_holes_renders():
     """2×1 half-grid with holes=True: hole_centres=[] so render is a no-op for holes."""
     b = GridfinityBox(2, 1, 3, half_grid=True, holes=True, fillet_interior=False)
     assert len(b.hole_centres) == 0
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_1x1_holes_renders():
     """1×1 half-grid with holes=True: hole_centres=[] so render is a no-op for holes."""
     b = GridfinityBox(1, 1, 3, half_grid=True, holes=True, fillet_interior=False)
     assert len(b.hole_centres) == 0
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_halfgrid_with_scoops_labels():
     """Half-grid bin with scoops and labels should render as valid solid."""
     b = GridfinityBox(4, 2, 4, half_grid=True, scoops=True, labels=True,
                       fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
+    _assert_valid(r)
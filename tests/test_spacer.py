@@ -1,24 +1,31 @@
 # Gridfinity tests
 import pytest
 
+from common_test import SKIP_TEST_SPACER
+
+# Skip the whole module, before importing cqgridfinity, when out of scope
+if SKIP_TEST_SPACER:
+    pytest.skip(
+        "Skipped intentionally by test scope environment variable",
+        allow_module_level=True,
+    )
+
 # my modules
+import cadquery as cq
 from cadquery import exporters
 from cqgridfinity import *
-from cqkit.cq_helpers import size_3d
 from cqkit import export_step_file
 
 from common_test import (
+    _assert_valid,
     EXPORT_STEP_FILE_PATH,
     _almost_same,
     _export_files,
     INCHES,
-    SKIP_TEST_SPACER,
+    size_3d_cached,
 )
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_SPACER, reason="Skipped intentionally by test scope environment variable"
-)
 def test_spacer():
     s0 = GridfinityDrawerSpacer(582, 481, tolerance=0.25)
     assert s0.size_u[0] == 13
@@ -62,9 +69,6 @@ def test_spacer():
     assert _almost_same(s1.width_th, 19.80, tol=0.01)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_SPACER, reason="Skipped intentionally by test scope environment variable"
-)
 def test_spacer_render():
     s1 = GridfinityDrawerSpacer(tolerance=0.25)
     dx, dy = INCHES(22 + 15 / 16), INCHES(16.25)
@@ -80,40 +84,41 @@ def test_spacer_render():
     assert _almost_same(s1.length_th, 17.12, tol=0.01)
     assert _almost_same(s1.width_th, 18.06, tol=0.01)
     r = s1.render_full_set()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (582.6125, 412.75, 4.75))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (582.6125, 412.75, 4.75))
     assert s1.filename() == "gf_drawer_4x3_full_set"
     if _export_files("spacer"):
         s1.save_step_file(path=EXPORT_STEP_FILE_PATH)
+    a = s1.render_assembly()
+    assert isinstance(a, cq.Assembly)
+    bb = a.toCompound().BoundingBox()
+    assert _almost_same((bb.xlen, bb.ylen, bb.zlen), (582.6125, 412.75, 4.75))
     rh = s1.render_half_set()
-    assert rh.val().isValid()
-    assert _almost_same(size_3d(rh), (253.084, 177.0625, 4.75))
+    _assert_valid(rh)
+    assert _almost_same(size_3d_cached(rh), (253.084, 177.0625, 4.75))
     assert s1.filename() == "gf_drawer_4x3_half_set"
     if _export_files("spacer"):
         s1.save_step_file(path=EXPORT_STEP_FILE_PATH)
 
     r = s1.render_length_filler()
-    assert r.val().isValid()
+    _assert_valid(r)
     assert s1.filename() == "gf_drawer_4x3_length_spacer"
     if _export_files("spacer"):
         s1.save_step_file(path=EXPORT_STEP_FILE_PATH)
 
     r = s1.render_width_filler()
-    assert r.val().isValid()
+    _assert_valid(r)
     assert s1.filename() == "gf_drawer_4x3_width_spacer"
     if _export_files("spacer"):
         s1.save_step_file(path=EXPORT_STEP_FILE_PATH)
 
     r = s1.render()
-    assert r.val().isValid()
+    _assert_valid(r)
     assert s1.filename() == "gf_drawer_4x3_corner_spacer"
     if _export_files("spacer"):
         s1.save_step_file(path=EXPORT_STEP_FILE_PATH)
 
 
-@pytest.mark.skipif(
-    SKIP_TEST_SPACER, reason="Skipped intentionally by test scope environment variable"
-)
 def test_back_only_spacer():
     s0 = GridfinityDrawerSpacer(tolerance=0.25, front_and_back=False)
     dx, dy = 414, 366
@@ -127,8 +132,8 @@ def test_back_only_spacer():
     assert _almost_same(s0.fb_length_th, 29.5, tol=0.01)
     assert _almost_same(s0.width_th, 17.75, tol=0.01)
     r = s0.render_full_set()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (414, 366, 4.75))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (414, 366, 4.75))
 
     s0 = GridfinityDrawerSpacer(tolerance=0.25, front_and_back=True)
     dx, dy = 414, 366
@@ -142,5 +147,5 @@ def test_back_only_spacer():
     assert _almost_same(s0.fb_length_th, 14.75, tol=0.01)
     assert _almost_same(s0.width_th, 17.75, tol=0.01)
     r = s0.render_full_set()
-    assert r.val().isValid()
-    assert _almost_same(size_3d(r), (414, 366, 4.75))
+    _assert_valid(r)
+    assert _almost_same(size_3d_cached(r), (414, 366, 4.75))
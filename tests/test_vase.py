@@ -8,9 +8,16 @@
 import pytest
 
 from cqgridfinity import GridfinityVaseBox, GridfinityVaseBase
-from cqkit.cq_helpers import size_3d
 from cqgridfinity.constants import GR_BASE_HEIGHT, GRHU
-from common_test import _almost_same, SKIP_TEST_BOX, _export_files, EXPORT_STEP_FILE_PATH
+from common_test import (
+    _assert_valid,
+    _almost_same,
+    box_scope,
+    _export_files,
+    EXPORT_STEP_FILE_PATH,
+    bbox_cached,
+    size_3d_cached,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -99,15 +106,33 @@ def test_vasebox_unknown_kwarg_warns():
 # VaseBox — renders (geometry validity + bbox)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_1x1_renders_valid():
-    """Basic 1×1×3 VaseBox renders a valid solid."""
-    b = GridfinityVaseBox(1, 1, 3)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        ((1, 1, 3), dict()),
+        # Multi-cell
+        ((2, 2, 3), dict()),
+        # No stacking lip
+        ((1, 1, 3), dict(enable_lip=False)),
+        # n_divx=2 (1 divider)
+        ((2, 1, 3), dict(n_divx=2)),
+        # style_base=4 (no X-cutouts) and style_base=1 (corners only)
+        ((1, 1, 3), dict(style_base=4)),
+        ((2, 2, 3), dict(style_base=1)),
+        ((1, 1, 3), dict(enable_scoop_chamfer=False)),
+        # style_tab=6 (no tab) and style_tab=3 (right tab)
+        ((1, 1, 3), dict(style_tab=6)),
+        ((1, 1, 3), dict(style_tab=3)),
+    ],
+)
+def test_vasebox_renders_valid(args, kwargs):
+    """VaseBox variants render a valid solid."""
+    r = GridfinityVaseBox(*args, **kwargs).cq_obj
+    _assert_valid(r)
+
+
+@box_scope
 def test_vasebox_1x1_height():
     """1×1×3 VaseBox (no lip, no tab) Z = b.height = 3.8 + 3*7 = 24.8mm.
 
@@ -116,85 +141,21 @@ def test_vasebox_1x1_height():
     """
     b = GridfinityVaseBox(1, 1, 3, enable_lip=False, style_tab=6)
     r = b.render()
-    _, _, sz = size_3d(r)
+    _, _, sz = size_3d_cached(r)
     assert _almost_same(sz, b.height, tol=0.3)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_2x2_renders_valid():
-    """Multi-cell 2×2×3 VaseBox renders a valid solid."""
-    b = GridfinityVaseBox(2, 2, 3)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_nolip_renders_valid():
-    """VaseBox without stacking lip renders valid."""
-    b = GridfinityVaseBox(1, 1, 3, enable_lip=False)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_vasebox_nolip_shorter():
     """VaseBox without lip is no taller than with lip (or same)."""
     b_lip = GridfinityVaseBox(1, 1, 3, enable_lip=True)
     b_nolip = GridfinityVaseBox(1, 1, 3, enable_lip=False)
-    _, _, sz_lip = size_3d(b_lip.render())
-    _, _, sz_nolip = size_3d(b_nolip.render())
+    _, _, sz_lip = size_3d_cached(b_lip.cq_obj)
+    _, _, sz_nolip = size_3d_cached(b_nolip.cq_obj)
     assert sz_nolip <= sz_lip + 0.1
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_dividers_renders_valid():
-    """VaseBox with n_divx=2 (1 divider) renders valid."""
-    b = GridfinityVaseBox(2, 1, 3, n_divx=2)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_style_base_none_renders_valid():
-    """style_base=4 (no X-cutouts) renders valid."""
-    b = GridfinityVaseBox(1, 1, 3, style_base=4)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_style_base_corners_renders_valid():
-    """style_base=1 (corners only) renders valid for 2×2."""
-    b = GridfinityVaseBox(2, 2, 3, style_base=1)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_no_scoop_chamfer():
-    """enable_scoop_chamfer=False renders valid."""
-    b = GridfinityVaseBox(1, 1, 3, enable_scoop_chamfer=False)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_tab_none():
-    """style_tab=6 (no tab) renders valid."""
-    b = GridfinityVaseBox(1, 1, 3, style_tab=6)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebox_tab_right():
-    """style_tab=3 (right tab) renders valid."""
-    b = GridfinityVaseBox(1, 1, 3, style_tab=3)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_vasebox_step_export(tmp_path):
     """VaseBox saves a valid STEP file."""
     b = GridfinityVaseBox(1, 1, 2)
@@ -268,64 +229,37 @@ def test_vasebase_filename_no_mag():
 # VaseBase — renders (geometry validity + bbox)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_1x1_renders_valid():
-    """VaseBase(1,1) renders a valid solid."""
-    b = GridfinityVaseBase(1, 1)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_2x2_renders_valid():
-    """VaseBase(2,2) renders a valid solid (multi-cell: tests rib/hole positioning)."""
-    b = GridfinityVaseBase(2, 2)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_no_holes_renders_valid():
-    """VaseBase(1,1, holes=False) renders a valid solid."""
-    b = GridfinityVaseBase(1, 1, holes=False)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_2x1_renders_valid():
-    """VaseBase(2,1) (non-square) renders valid (tests asymmetric coord offsets)."""
-    b = GridfinityVaseBase(2, 1)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_style_base_corners():
-    """VaseBase style_base=1 (corners) renders valid."""
-    b = GridfinityVaseBase(2, 2, style_base=1)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
-def test_vasebase_style_base_none():
-    """VaseBase style_base=4 (no X-protrusion) renders valid."""
-    b = GridfinityVaseBase(1, 1, style_base=4)
-    r = b.render()
-    assert r.val().isValid()
-
-
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        ((1, 1), dict()),
+        # Multi-cell: tests rib/hole positioning
+        ((2, 2), dict()),
+        ((1, 1), dict(holes=False)),
+        # Non-square: tests asymmetric coord offsets
+        ((2, 1), dict()),
+        # style_base=1 (corners) and style_base=4 (no X-protrusion)
+        ((2, 2), dict(style_base=1)),
+        ((1, 1), dict(style_base=4)),
+    ],
+)
+def test_vasebase_renders_valid(args, kwargs):
+    """VaseBase variants render a valid solid."""
+    r = GridfinityVaseBase(*args, **kwargs).cq_obj
+    _assert_valid(r)
+
+
+@box_scope
 def test_vasebase_sits_at_z0():
     """VaseBase bottom is at z=0 (world origin)."""
     b = GridfinityVaseBase(1, 1)
-    r = b.render()
-    bb = r.val().BoundingBox()
+    r = b.cq_obj
+    bb = bbox_cached(r)
     assert abs(bb.zmin) < 0.3  # base profile bottom at/near z=0
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_vasebase_step_export(tmp_path):
     """VaseBase saves a valid STEP file."""
     b = GridfinityVaseBase(1, 1)
@@ -336,15 +270,15 @@ def test_vasebase_step_export(tmp_path):
 # VaseBox + VaseBase — pair dimensions match
 # ---------------------------------------------------------------------------
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_vase_pair_xy_match():
     """VaseBox and VaseBase XY footprint matches (base fits inside shell)."""
     box = GridfinityVaseBox(2, 2, 3)
     base = GridfinityVaseBase(2, 2)
     rb = box.render()
     rbase = base.render()
-    sx_box, sy_box, _ = size_3d(rb)
-    sx_base, sy_base, _ = size_3d(rbase)
+    sx_box, sy_box, _ = size_3d_cached(rb)
+    sx_base, sy_base, _ = size_3d_cached(rbase)
     # Base must fit inside box (toleranced slightly smaller)
     assert sx_base <= sx_box + 1.0
     assert sy_base <= sy_box + 1.0
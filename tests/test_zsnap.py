@@ -8,12 +8,9 @@
 #   - Mode 0 with integer height_u: always a no-op (7*z is already a multiple of 7)
 #   - Filename suffix _zs when enable_zsnap=True
 
-import pytest
-
 from cqgridfinity import GridfinityBox
-from cqkit.cq_helpers import size_3d
 from cqgridfinity.constants import GRHU, GR_LIP_H, GR_BOT_H, GR_STACKING_LIP_H
-from common_test import _almost_same, SKIP_TEST_BOX
+from common_test import _almost_same, box_scope, size_3d_cached, _assert_valid
 
 
 # ---------------------------------------------------------------------------
@@ -186,23 +183,23 @@ def test_zsnap_filename_with_mode():
 # Render test (geometry validity)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_zsnap_renders_valid_solid():
     """A z-snapped bin (mode 1, 25mm → 28mm) renders a valid solid with correct Z."""
     b = GridfinityBox(2, 2, 25.0, gridz_define=1, enable_zsnap=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     expected_z = 28.0 + GR_LIP_H + GR_BOT_H
     assert _almost_same(sz, expected_z, tol=0.2)
 
 
-@pytest.mark.skipif(SKIP_TEST_BOX, reason="Skipped by SKIP_TEST_BOX env var")
+@box_scope
 def test_zsnap_mode0_float_renders():
     """Z-snap on mode 0 float height_u (2.5→3 units) renders valid solid."""
     b = GridfinityBox(2, 2, 2.5, enable_zsnap=True, fillet_interior=False)
     r = b.render()
-    assert r.val().isValid()
-    sx, sy, sz = size_3d(r)
+    _assert_valid(r)
+    sx, sy, sz = size_3d_cached(r)
     expected_z = 3.8 + 3 * GRHU  # 24.8mm
     assert _almost_same(sz, expected_z, tol=0.2)